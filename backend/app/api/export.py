@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import orjson
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException
 from fastapi.responses import Response
 from app.core.dependencies import get_current_user
+from app.db.cache import content_hash, get_result_cache
 from app.schemas.export import ExportRequest
-from app.services.pdf_generator import ResumePDFGenerator
-from app.api.resume import resumes_db
+from app.services.pdf_generator import get_pdf_pool, render_pdf_bytes
+from app.db.resume_store import get_resume_store
 
 
 router = APIRouter()
@@ -12,7 +16,8 @@ router = APIRouter()
 @router.post("/pdf")
 async def export_pdf(
     request: ExportRequest,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Export resume to professional one-page PDF
@@ -21,11 +26,10 @@ async def export_pdf(
     Automatically fits content to one page.
     """
     # Get resume
-    if request.resume_id not in resumes_db:
+    resume_obj = await get_resume_store().get(request.resume_id)
+    if resume_obj is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume_obj = resumes_db[request.resume_id]
-
     # Verify ownership
     if resume_obj.user_id != user["uid"]:
         raise HTTPException(status_code=403, detail="Access denied")
@@ -36,20 +40,40 @@ async def export_pdf(
     font_size = options.get("font_size", 10)
     theme = options.get("theme", "professional")
 
-    # Generate PDF
-    try:
-        pdf_buffer = ResumePDFGenerator.generate(
-            resume=resume_obj.data,
-            font_family=font_family,
-            font_size=font_size,
-            theme=theme
-        )
-        pdf_bytes = pdf_buffer.getvalue()
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"PDF generation failed: {str(e)}"
-        )
+    # Same resume version + options always render the same PDF. Keying on
+    # updated_at avoids serializing the whole resume just to hash it.
+    pdf_hash = content_hash(
+        request.resume_id,
+        resume_obj.updated_at.isoformat(),
+        orjson.dumps(options, option=orjson.OPT_SORT_KEYS)
+    )
+    etag = f'"{pdf_hash}"'
+
+    # Client already has this exact PDF
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    cache = get_result_cache()
+    cache_key = f"pdf:{pdf_hash}"
+    pdf_bytes = await cache.get(cache_key)
+
+    # Generate PDF in a worker process so ReportLab doesn't block the event loop
+    if pdf_bytes is None:
+        try:
+            pdf_bytes = await asyncio.get_running_loop().run_in_executor(
+                get_pdf_pool(),
+                render_pdf_bytes,
+                resume_obj.data.model_dump(),
+                font_family,
+                font_size,
+                theme
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"PDF generation failed: {str(e)}"
+            )
+        await cache.set(cache_key, pdf_bytes)
 
     # Return PDF file
     filename = resume_obj.name.replace('.pdf', '') + '_optimized.pdf'
@@ -57,6 +81,7 @@ async def export_pdf(
         content=pdf_bytes,
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f'attachment; filename="{filename}"'
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "ETag": etag
         }
     )
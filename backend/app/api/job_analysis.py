@@ -6,9 +6,11 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import Optional
 
+from app.core.clients import get_openai_client
 from app.core.dependencies import get_current_user
 from app.services.job_analyzer import JobAnalyzer, JobAnalysisResult, ResumeGapAnalysis
-from app.api.resume import resumes_db
+from app.db.cache import get_result_cache
+from app.db.resume_store import get_resume_store
 
 
 router = APIRouter()
@@ -29,7 +31,8 @@ class AnalyzeJobResponse(BaseModel):
 @router.post("/analyze", response_model=AnalyzeJobResponse)
 async def analyze_job_description(
     request: AnalyzeJobRequest,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    client=Depends(get_openai_client)
 ):
     """
     Analyze a job description to extract requirements.
@@ -38,7 +41,7 @@ async def analyze_job_description(
     
     Uses GPT-4o-mini for cost optimization.
     """
-    analyzer = JobAnalyzer()
+    analyzer = JobAnalyzer(client)
     
     # Analyze job description
     job_analysis = await analyzer.analyze_job_description(request.job_description)
@@ -47,17 +50,16 @@ async def analyze_job_description(
     
     # Optional: Compare with resume
     if request.resume_id:
-        if request.resume_id not in resumes_db:
+        resume_obj = await get_resume_store().get(request.resume_id)
+        if resume_obj is None:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        resume_obj = resumes_db[request.resume_id]
-        
         # Verify ownership
         if resume_obj.user_id != user["uid"]:
             raise HTTPException(status_code=403, detail="Access denied")
         
         # Convert resume to text for analysis
-        resume_text = _resume_to_text(resume_obj.data)
+        resume_text = await _get_resume_text(resume_obj)
         
         # Perform gap analysis
         gap_analysis = await analyzer.analyze_resume_gaps(resume_text, job_analysis)
@@ -68,35 +70,56 @@ async def analyze_job_description(
     )
 
 
+async def _get_resume_text(resume_obj) -> str:
+    """
+    Plain-text resume for analysis, cached per resume version.
+    The key includes updated_at, so any edit produces a fresh entry.
+    """
+    cache = get_result_cache()
+    cache_key = f"resume_text:{resume_obj.resume_id}:{resume_obj.updated_at.isoformat()}"
+
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached.decode("utf-8")
+
+    resume_text = _resume_to_text(resume_obj.data)
+    await cache.set(cache_key, resume_text.encode("utf-8"))
+    return resume_text
+
+
 def _resume_to_text(resume_data) -> str:
     """Convert resume object to plain text for analysis"""
     parts = []
-    
+
     # Header
-    if resume_data.header:
-        parts.append(resume_data.header.get("name", ""))
-        parts.append(resume_data.header.get("title", ""))
-    
+    header = resume_data.header
+    if header:
+        parts.append(f"{header.get('name', '')}\n{header.get('title', '')}")
+
     # Summary
     if resume_data.summary:
         parts.append(resume_data.summary)
-    
+
     # Experience
     for exp in resume_data.experience:
         parts.append(f"{exp.title} at {exp.company}")
         parts.extend(exp.bullets)
-    
+
     # Projects
     for proj in resume_data.projects:
         parts.append(proj.name)
         parts.extend(proj.bullets)
-    
+
     # Skills
-    for category, skills in resume_data.skills.items():
-        parts.append(f"{category}: {', '.join(skills)}")
-    
+    parts.extend(
+        f"{category}: {', '.join(skills)}"
+        for category, skills in resume_data.skills.items()
+    )
+
     # Education
-    for edu in resume_data.education:
-        parts.append(f"{edu.degree} from {edu.institution}")
-    
+    parts.extend(
+        f"{edu.degree} from {edu.institution}"
+        for edu in resume_data.education
+    )
+
     return "\n".join(parts)
@@ -3,11 +3,16 @@ Optimization API
 Endpoints for AI-powered content improvement.
 """
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any
 
+from app.core.clients import get_openai_client
 from app.core.dependencies import get_current_user
+from app.db.batch_jobs import get_batch_job_store
+from app.db.cache import content_hash, get_result_cache
 from app.services.optimizer import OptimizationService
+from app.services.bullet_batcher import get_bullet_batcher
 
 
 router = APIRouter()
@@ -17,6 +22,7 @@ class OptimizeBulletRequest(BaseModel):
     """Request to optimize a single bullet"""
     bullet: str
     context: Dict[str, Any] = {}  # job_title, company, etc.
+    regenerate: bool = False  # Skip the cached rewrite and sample a new one
 
 
 class OptimizeBulletResponse(BaseModel):
@@ -41,18 +47,30 @@ async def optimize_bullet(
         Output: "Led cross-functional team of 5 engineers on 3 high-impact projects, reducing delivery time by 30%"
     
     Cost: ~$0.005 per bullet
+
+    Rewrites are cached per bullet and context; set regenerate to get a
+    different one.
     """
+    job_title = request.context.get("job_title", "")
+    company = request.context.get("company", "")
+
     try:
-        optimizer = OptimizationService()
-        
-        # Use the optimizer service
-        # Note: OptimizationService.optimize_bullet expects different signature
-        # We'll adapt it here
-        result = await optimizer.optimize_bullet(
-            bullet=request.bullet,
-            job_title=request.context.get("job_title", ""),
-            company=request.context.get("company", "")
-        )
+        cache = get_result_cache()
+        cache_key = "bullet:" + content_hash(request.bullet, job_title, company)
+        cached = None if request.regenerate else await cache.get(cache_key)
+
+        if cached is not None:
+            result = cached.decode("utf-8")
+        else:
+            # Concurrent requests are coalesced into shared completions
+            result = await get_bullet_batcher().submit(
+                bullet=request.bullet,
+                job_title=job_title,
+                company=company
+            )
+            # Only cache real rewrites, not fallbacks to the original
+            if result != request.bullet:
+                await cache.set(cache_key, result.encode("utf-8"))
         
         return OptimizeBulletResponse(
             optimized=result,
@@ -71,23 +89,73 @@ class OptimizeResumeRequest(BaseModel):
     """Request to optimize full resume"""
     resume_data: Dict[str, Any]
     job_description: str
+    batch: bool = False  # Submit via OpenAI Batch API (~50% cheaper, async)
+    regenerate: bool = False  # Skip cached rewrites and sample new ones
 
 
 @router.post("/resume")
 async def optimize_resume(
     request: OptimizeResumeRequest,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    client=Depends(get_openai_client)
 ):
     """
     Optimize entire resume based on job description.
     Returns a map of original -> optimized bullets.
+
+    With batch=True, submits a Batch API job instead and returns
+    202 Accepted with a poll URL (see GET /optimize/batch/{batch_id}).
     """
     try:
-        optimizer = OptimizationService()
+        optimizer = OptimizationService(client)
+
+        if request.batch:
+            job = await optimizer.submit_resume_batch(
+                request.resume_data,
+                request.job_description
+            )
+            await get_batch_job_store().set_owner(job["batch_id"], user["uid"])
+            return ORJSONResponse(
+                status_code=202,
+                content={
+                    **job,
+                    "poll_url": f"/api/optimize/batch/{job['batch_id']}"
+                }
+            )
+
         result = await optimizer.optimize_resume(
             request.resume_data,
-            request.job_description
+            request.job_description,
+            regenerate=request.regenerate
         )
         return result
+    except ValueError as e:
+        # Invalid input, e.g. a resume with no bullets to optimize
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/batch/{batch_id}")
+async def get_optimize_batch(
+    batch_id: str,
+    user: dict = Depends(get_current_user),
+    client=Depends(get_openai_client)
+):
+    """
+    Poll a batch optimization job.
+    Once status is "completed", optimized holds the original -> optimized map.
+    """
+    owner = await get_batch_job_store().get_owner(batch_id)
+    if owner is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    # Verify ownership
+    if owner != user["uid"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    try:
+        optimizer = OptimizationService(client)
+        return await optimizer.get_resume_batch(batch_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
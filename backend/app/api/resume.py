@@ -1,16 +1,16 @@
 import uuid
+from operator import attrgetter
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List
-from datetime import datetime
+from datetime import datetime, timezone
 from app.core.dependencies import get_current_user
+from app.db.resume_store import get_resume_store
 from app.schemas.resume import ResumeCreate, ResumeUpdate, ResumeResponse, SectionReorderRequest, DocumentStructure
 
 
-router = APIRouter()
+UTC = timezone.utc
 
-# In-memory storage for MVP
-# In production, replace with database calls
-resumes_db = {}
+router = APIRouter()
 
 
 @router.post("/", response_model=ResumeResponse)
@@ -19,8 +19,8 @@ async def create_resume(
     user: dict = Depends(get_current_user)
 ):
     """Create new resume"""
-    resume_id = str(uuid.uuid4())
-    now = datetime.utcnow()
+    resume_id = uuid.uuid4().hex
+    now = datetime.now(UTC)
 
     resume_data = ResumeResponse(
         resume_id=resume_id,
@@ -32,7 +32,7 @@ async def create_resume(
         updated_at=now
     )
 
-    resumes_db[resume_id] = resume_data
+    await get_resume_store().put(resume_data)
 
     return resume_data
 
@@ -43,11 +43,10 @@ async def get_resume(
     user: dict = Depends(get_current_user)
 ):
     """Get resume by ID"""
-    if resume_id not in resumes_db:
+    resume = await get_resume_store().get(resume_id)
+    if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume = resumes_db[resume_id]
-
     # Verify ownership
     if resume.user_id != user["uid"]:
         raise HTTPException(status_code=403, detail="Access denied")
@@ -62,11 +61,11 @@ async def update_resume(
     user: dict = Depends(get_current_user)
 ):
     """Update resume"""
-    if resume_id not in resumes_db:
+    store = get_resume_store()
+    resume = await store.get(resume_id)
+    if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume = resumes_db[resume_id]
-
     # Verify ownership
     if resume.user_id != user["uid"]:
         raise HTTPException(status_code=403, detail="Access denied")
@@ -81,7 +80,8 @@ async def update_resume(
     if update.target_job_intelligence_id is not None:
         resume.target_job_intelligence_id = update.target_job_intelligence_id
 
-    resume.updated_at = datetime.utcnow()
+    resume.updated_at = datetime.now(UTC)
+    await store.put(resume)
 
     return resume
 
@@ -92,16 +92,16 @@ async def delete_resume(
     user: dict = Depends(get_current_user)
 ):
     """Delete resume"""
-    if resume_id not in resumes_db:
+    store = get_resume_store()
+    resume = await store.get(resume_id)
+    if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume = resumes_db[resume_id]
-
     # Verify ownership
     if resume.user_id != user["uid"]:
         raise HTTPException(status_code=403, detail="Access denied")
 
-    del resumes_db[resume_id]
+    await store.delete(resume_id, resume.user_id)
 
     return {"message": "Resume deleted successfully"}
 
@@ -111,12 +111,9 @@ async def list_resumes(
     user: dict = Depends(get_current_user)
 ):
     """List all user's resumes"""
-    user_resumes = [
-        resume for resume in resumes_db.values()
-        if resume.user_id == user["uid"]
-    ]
+    user_resumes = await get_resume_store().list_by_user(user["uid"])
 
-    return sorted(user_resumes, key=lambda x: x.updated_at, reverse=True)
+    return sorted(user_resumes, key=attrgetter("updated_at"), reverse=True)
 
 
 @router.post("/{resume_id}/reorder-sections", response_model=ResumeResponse)
@@ -131,11 +128,11 @@ async def reorder_sections(
     This endpoint allows users to drag and drop sections to change their order
     in the final PDF export. The order is stored in the resume's structure metadata.
     """
-    if resume_id not in resumes_db:
+    store = get_resume_store()
+    resume = await store.get(resume_id)
+    if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
 
-    resume = resumes_db[resume_id]
-
     # Verify ownership
     if resume.user_id != user["uid"]:
         raise HTTPException(status_code=403, detail="Access denied")
@@ -148,6 +145,7 @@ async def reorder_sections(
     resume.data.structure.section_order = reorder.section_order
     resume.data.structure.sections_present = reorder.section_order  # sections_present mirrors section_order
 
-    resume.updated_at = datetime.utcnow()
+    resume.updated_at = datetime.now(UTC)
+    await store.put(resume)
 
     return resume
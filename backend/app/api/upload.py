@@ -1,19 +1,71 @@
+import hashlib
+import logging
 import uuid
 from pathlib import Path
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
 from app.core.dependencies import get_current_user
+from app.core.clients import get_openai_client
 from app.core.config import get_settings
 from app.services.pipeline import ResumeParsingPipeline
 from app.schemas.resume import ResumeResponse, Resume
-from datetime import datetime
+from datetime import datetime, timezone
 import aiofiles
+import orjson
 import os
 
-# Import the in-memory database from resume.py
-from app.api.resume import resumes_db
+from app.db.cache import get_result_cache
+from app.db.resume_store import get_resume_store
+
+UTC = timezone.utc
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Read size for streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Accepted resume file types
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".docx", ".doc", ".txt"})
+
+# Leading magic bytes each binary type must start with (.txt is not sniffed)
+FILE_SIGNATURES = {
+    ".pdf": b"%PDF-",
+    ".docx": b"PK\x03\x04",  # ZIP container
+    ".doc": b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1",  # OLE2 compound file
+}
+
+# Hot settings bound once at import
+_settings = get_settings()
+UPLOAD_DIR = Path(_settings.UPLOAD_DIR)
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+MAX_UPLOAD_SIZE = _settings.MAX_UPLOAD_SIZE
+OPENAI_API_KEY = _settings.OPENAI_API_KEY
+
+# Shared parsing pipeline
+_pipeline = None
+
+
+def get_pipeline() -> ResumeParsingPipeline:
+    """Get or create the shared parsing pipeline"""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = ResumeParsingPipeline(
+            openai_api_key=OPENAI_API_KEY,
+            client=get_openai_client()
+        )
+    return _pipeline
+
+
+def _reset_after_fork():
+    """Drop the inherited pipeline (and its OpenAI client) in a forked child"""
+    global _pipeline
+    _pipeline = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 
 @router.post("/", response_model=ResumeResponse)
 async def upload_resume(
@@ -26,83 +78,116 @@ async def upload_resume(
     Accepts PDF, DOCX, or TXT files.
     Returns structured Resume JSON.
     """
-    settings = get_settings()
-
     # Validate file type
-    allowed_extensions = {".pdf", ".docx", ".doc", ".txt"}
     file_ext = Path(file.filename).suffix.lower()
 
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
+            detail=f"Invalid file type. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
         )
 
-    # Create upload directory if it doesn't exist
-    upload_dir = Path(settings.UPLOAD_DIR)
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
     # Generate unique filename
-    file_id = str(uuid.uuid4())
-    file_path = upload_dir / f"{file_id}{file_ext}"
-
-    # Save uploaded file
+    file_id = uuid.uuid4().hex
+    file_path = UPLOAD_DIR / f"{file_id}{file_ext}"
+
+    # Stream uploaded file to disk in fixed-size chunks (constant memory)
+    # Hash while streaming so identical files can reuse an earlier parse
+    bytes_written = 0
+    digest = hashlib.blake2b(digest_size=16)
+    signature = FILE_SIGNATURES.get(file_ext)
+    signature_ok = True
     try:
         async with aiofiles.open(file_path, 'wb') as out_file:
-            content = await file.read()
-            await out_file.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                # Check the content matches the extension before saving anything
+                if signature is not None and bytes_written == 0 and not chunk.startswith(signature):
+                    signature_ok = False
+                    break
+                bytes_written += len(chunk)
+                if bytes_written > MAX_UPLOAD_SIZE:
+                    break
+                digest.update(chunk)
+                await out_file.write(chunk)
     except Exception as e:
+        if file_path.exists():
+            os.remove(file_path)
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
 
-    # Parse resume using NEW 7-stage pipeline (LLM REQUIRED)
-    try:
-        print(f"[UPLOAD] Starting 7-stage pipeline for {file.filename}")
-
-        # Initialize pipeline with OpenAI API key (REQUIRED)
-        pipeline = ResumeParsingPipeline(openai_api_key=settings.OPENAI_API_KEY)
-
-        # Run Stages 1-4: Raw extraction → LLM parsing → Cleanup → Canonical JSON
-        result = await pipeline.parse_resume(file_path)
-
-        # Extract canonical JSON (this is the single source of truth)
-        canonical = result["canonical"]
-        layout_data = result["layout"]  # Layout engine output from Stage 5
-        metadata = result["metadata"]
-
-        print(f"[UPLOAD] Canonical JSON created with {len(canonical.get('experience', []))} experience entries")
-        print(f"[UPLOAD] Layout: compression={metadata.get('layout_compression', 0)}, sections={metadata.get('sections_found', 0)}")
-
-        # Convert canonical to Resume schema format (for backward compatibility with frontend)
-        resume_data = Resume(
-            header=canonical.get("header", {}),
-            summary=canonical.get("summary", ""),
-            experience=canonical.get("experience", []),
-            projects=canonical.get("projects", []),
-            skills=canonical.get("skills", {}),
-            education=canonical.get("education", []),
-            certifications=canonical.get("certifications", []),
-            awards=canonical.get("awards", []),
-            flexible_sections=[]
+    if not signature_ok:
+        os.remove(file_path)
+        raise HTTPException(
+            status_code=400,
+            detail=f"File content does not match its {file_ext} extension"
         )
 
-        print(f"[UPLOAD] Resume data conversion complete")
-
-    except Exception as e:
-        # Clean up file on parse error
-        print(f"[UPLOAD ERROR] {str(e)}")
-        import traceback
-        traceback.print_exc()
-        if file_path.exists():
-            os.remove(file_path)
-        raise HTTPException(status_code=500, detail=f"Failed to parse resume: {str(e)}")
-    finally:
-        # Clean up temporary file
-        if file_path.exists():
-            os.remove(file_path)
+    if bytes_written > MAX_UPLOAD_SIZE:
+        os.remove(file_path)
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {MAX_UPLOAD_SIZE} bytes"
+        )
 
-    # Save to in-memory database
-    resume_id = str(uuid.uuid4())
-    now = datetime.utcnow()
+    cache = get_result_cache()
+    cache_key = f"parsed_resume:{file_ext}:{digest.hexdigest()}"
+    cached = await cache.get(cache_key)
+
+    if cached is not None:
+        os.remove(file_path)
+        parsed = orjson.loads(cached)
+        resume_data = Resume.model_validate(parsed["data"])
+        layout_data = parsed["layout"]
+    else:
+        # Parse resume using NEW 7-stage pipeline (LLM REQUIRED)
+        try:
+            pipeline = get_pipeline()
+
+            # Run Stages 1-4: Raw extraction → LLM parsing → Cleanup → Canonical JSON
+            result = await pipeline.parse_resume(file_path)
+
+            # Extract canonical JSON (this is the single source of truth)
+            canonical = result["canonical"]
+            layout_data = result["layout"]  # Layout engine output from Stage 5
+            metadata = result["metadata"]
+
+            logger.debug(
+                "Parsed %s: %d experience entries, compression=%s, sections=%s",
+                file.filename, len(canonical.get("experience", [])),
+                metadata.get("layout_compression", 0), metadata.get("sections_found", 0)
+            )
+
+            # Convert canonical to Resume schema format (for backward compatibility with frontend)
+            resume_data = Resume(
+                header=canonical.get("header", {}),
+                summary=canonical.get("summary", ""),
+                experience=canonical.get("experience", []),
+                projects=canonical.get("projects", []),
+                skills=canonical.get("skills", {}),
+                education=canonical.get("education", []),
+                certifications=canonical.get("certifications", []),
+                awards=canonical.get("awards", []),
+                flexible_sections=[]
+            )
+
+        except Exception as e:
+            # Clean up file on parse error
+            logger.exception("Failed to parse upload %s", file.filename)
+            if file_path.exists():
+                os.remove(file_path)
+            raise HTTPException(status_code=500, detail=f"Failed to parse resume: {str(e)}")
+        finally:
+            # Clean up temporary file
+            if file_path.exists():
+                os.remove(file_path)
+
+        await cache.set(cache_key, orjson.dumps({
+            "data": resume_data.model_dump(mode="json"),
+            "layout": layout_data
+        }))
+
+    # Save to resume store
+    resume_id = uuid.uuid4().hex
+    now = datetime.now(UTC)
 
     resume_response = ResumeResponse(
         resume_id=resume_id,
@@ -115,6 +200,6 @@ async def upload_resume(
     )
 
     # Store in database
-    resumes_db[resume_id] = resume_response
+    await get_resume_store().put(resume_response)
 
     return resume_response
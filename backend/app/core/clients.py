@@ -0,0 +1,77 @@
+"""
+Shared outbound HTTP clients
+
+One pooled HTTP/2 connection set per process, reused by every OpenAI
+call instead of opening a new TCP/TLS connection per request.
+"""
+import os
+from typing import Optional
+
+import httpx
+
+try:
+    from openai import AsyncOpenAI
+    OPENAI_AVAILABLE = True
+except ImportError:
+    AsyncOpenAI = None
+    OPENAI_AVAILABLE = False
+
+from app.core.config import get_settings
+
+
+# Global client instances
+_http_client: Optional[httpx.AsyncClient] = None
+_openai_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared pooled HTTP/2 client (singleton)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(60.0)
+        )
+    return _http_client
+
+
+def get_openai_client() -> Optional["AsyncOpenAI"]:
+    """
+    Get the shared AsyncOpenAI client (singleton)
+
+    Usable as a FastAPI dependency. Returns None when no API key is
+    configured or the openai package is missing, so callers can fall back.
+    """
+    global _openai_client
+    if _openai_client is None:
+        settings = get_settings()
+        if not settings.OPENAI_API_KEY or not OPENAI_AVAILABLE:
+            return None
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=get_http_client(),
+            # The only retry layer: backs off on 429/5xx, honoring Retry-After
+            max_retries=settings.OPENAI_MAX_RETRIES
+        )
+    return _openai_client
+
+
+def _reset_after_fork():
+    """Drop inherited clients in a forked child so it opens its own sockets"""
+    global _http_client, _openai_client
+    _http_client = None
+    _openai_client = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+async def close_clients():
+    """Close pooled connections (app shutdown)"""
+    global _http_client, _openai_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+    _openai_client = None
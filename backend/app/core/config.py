@@ -2,11 +2,19 @@
 Application Configuration
 """
 from typing import List, Optional
-from pydantic import Field, validator
+import orjson
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
 
 
+def _parse_json_list(v):
+    """Accept list-typed env vars given as JSON strings"""
+    if isinstance(v, str):
+        return orjson.loads(v)
+    return v
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
 
@@ -29,18 +37,32 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
     DATABASE_ECHO: bool = False
+    DATABASE_WARM_POOL: bool = False  # Open DATABASE_POOL_SIZE connections at startup
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
 
+    # Storage
+    STORAGE_BACKEND: str = "memory"  # memory (single process) or redis
+    CACHE_TTL_SECONDS: int = 86400  # Cached PDFs / LLM rewrites
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024  # In-memory cache budget (0 = unbounded)
+    RESUME_CACHE_TTL_SECONDS: int = 0  # Per-worker cache of Redis resume reads (0 = off)
+
     # OpenAI
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-4o-mini"
     OPENAI_FALLBACK_MODEL: str = "gpt-3.5-turbo"
     OPENAI_TEMPERATURE: float = 0.0
     OPENAI_MAX_TOKENS: int = 4096
+    OPENAI_MAX_CONCURRENCY: int = 10  # In-flight chunk completions per process
+    OPENAI_MAX_RETRIES: int = 3  # OpenAI client retries on 429/5xx responses
+    STAGE2_PARALLEL_SECTIONS: bool = False  # Parse sections in 4 concurrent calls (faster, ~4x input tokens)
+
+    # Bullet micro-batching (/optimize/bullet)
+    BATCH_WINDOW_MS: int = 30  # Collect concurrent requests for this long
+    BATCH_MAX_SIZE: int = 8  # Max bullets per shared completion
 
     # LM Studio (Local Fallback)
     LM_STUDIO_URL: str = "http://localhost:1234/v1"
@@ -65,24 +87,23 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:3001"]
 
-    @validator("CORS_ORIGINS", pre=True)
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
     def parse_cors_origins(cls, v):
-        if isinstance(v, str):
-            import json
-            return json.loads(v)
-        return v
+        return _parse_json_list(v)
 
     # File Upload
     MAX_UPLOAD_SIZE: int = 10485760  # 10MB
     ALLOWED_EXTENSIONS: List[str] = [".pdf", ".docx", ".doc"]
     UPLOAD_DIR: str = "./uploads"
 
-    @validator("ALLOWED_EXTENSIONS", pre=True)
+    @field_validator("ALLOWED_EXTENSIONS", mode="before")
+    @classmethod
     def parse_allowed_extensions(cls, v):
-        if isinstance(v, str):
-            import json
-            return json.loads(v)
-        return v
+        return _parse_json_list(v)
+
+    # PDF Export
+    PDF_WORKERS: int = 0  # Rendering processes (0 = CPU count)
 
     # Layout Templates
     DEFAULT_TEMPLATE: str = "modern_tech"
@@ -1,51 +1,84 @@
 """
 Database configuration and session management
 """
-from typing import Generator
-from sqlalchemy import create_engine
+import asyncio
+from typing import Any, AsyncGenerator
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
 from .config import get_settings
 
 settings = get_settings()
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
+
+def _json_serializer(obj: Any) -> str:
+    """orjson encoder for JSON/JSONB columns (SQLAlchemy expects str)"""
+    return orjson.dumps(obj).decode("utf-8")
+
+
+# Create async SQLAlchemy engine (asyncpg driver, never blocks the event loop)
+engine = create_async_engine(
+    settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1),
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,  # Verify connections before using
+    pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
+    pool_recycle=1800,  # Replace connections older than 30 minutes
     echo=settings.DATABASE_ECHO,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 # Base class for all models
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency for database session
 
+    The whole request runs in one transaction: committed when the
+    endpoint returns, rolled back if it raises.
+
     Usage in FastAPI:
         @router.get("/")
-        async def endpoint(db: Session = Depends(get_db)):
+        async def endpoint(db: AsyncSession = Depends(get_db)):
             ...
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal.begin() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
+async def warm_pool():
+    """Open pool_size connections up front so early requests skip the handshake"""
+    conns = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.DATABASE_POOL_SIZE))
+    )
+    for conn in conns:
+        await conn.close()
+
+
+async def init_db():
     """Initialize database (create tables)"""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def drop_db():
+async def drop_db():
     """Drop all tables (for testing)"""
-    Base.metadata.drop_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+if __name__ == "__main__":
+    import app.models  # noqa: F401  (register tables on Base.metadata)
+
+    asyncio.run(init_db())
@@ -1,21 +1,39 @@
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 import firebase_admin
 from firebase_admin import credentials, auth
-from functools import lru_cache
+from typing import Tuple
 from app.core.config import get_settings
 
 
-@lru_cache()
-def initialize_firebase():
-    """Initialize Firebase Admin SDK"""
-    settings = get_settings()
+# Verified claims keyed by token digest -> (claims, expires_at).
+# Entries live at most TOKEN_CACHE_TTL seconds and never past the token's exp,
+# so revocations are picked up within a few minutes.
+TOKEN_CACHE_TTL = 300
+TOKEN_CACHE_MAX_SIZE = 10_000
+token_cache: "OrderedDict[bytes, Tuple[dict, float]]" = OrderedDict()
+
+_initialized = False
+_init_lock = threading.Lock()
 
-    if not firebase_admin._apps:
-        cred = credentials.Certificate(settings.FIREBASE_CREDENTIALS_PATH)
-        firebase_admin.initialize_app(cred, {
-            'projectId': settings.FIREBASE_PROJECT_ID,
-        })
 
-    return firebase_admin.get_app()
+def initialize_firebase():
+    """Initialize Firebase Admin SDK (called once at app startup)"""
+    global _initialized
+    if _initialized:
+        return
+
+    with _init_lock:
+        if not firebase_admin._apps:
+            settings = get_settings()
+            cred = credentials.Certificate(settings.FIREBASE_CREDENTIALS_PATH)
+            firebase_admin.initialize_app(cred, {
+                'projectId': settings.FIREBASE_PROJECT_ID,
+            })
+        _initialized = True
 
 
 async def verify_firebase_token(token: str) -> dict:
@@ -31,9 +49,20 @@ async def verify_firebase_token(token: str) -> dict:
     Raises:
         ValueError: If token is invalid or expired
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    cached = token_cache.get(key)
+    if cached is not None:
+        if now < cached[1]:
+            return cached[0]
+        del token_cache[key]
+
     try:
-        initialize_firebase()
-        decoded_token = auth.verify_id_token(token)
+        decoded_token = await asyncio.to_thread(auth.verify_id_token, token)
+        token_cache[key] = (decoded_token, min(now + TOKEN_CACHE_TTL, decoded_token["exp"]))
+        # Insertion order tracks age, so the oldest entries go first
+        while len(token_cache) > TOKEN_CACHE_MAX_SIZE:
+            token_cache.popitem(last=False)
         return decoded_token
     except Exception as e:
         raise ValueError(f"Invalid authentication token: {str(e)}")
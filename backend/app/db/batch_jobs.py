@@ -0,0 +1,64 @@
+"""
+Batch Job Ownership
+Records which user submitted each OpenAI batch so any worker can authorize a poll.
+Uses Redis when STORAGE_BACKEND=redis, process memory otherwise (single worker only).
+
+Redis layout:
+    batch_job:{batch_id}     STRING  owner uid, expires after BATCH_JOB_TTL
+"""
+from typing import Dict, Optional
+
+from app.core.config import get_settings
+from app.db.redis_client import get_redis
+
+
+# Batches complete within 24h; keep ownership long enough to collect results
+BATCH_JOB_TTL = 7 * 24 * 3600
+
+
+class BatchJobStore:
+    """In-memory batch ownership (single process, MVP default)"""
+
+    def __init__(self):
+        self._owners: Dict[str, str] = {}
+
+    async def set_owner(self, batch_id: str, user_id: str) -> None:
+        self._owners[batch_id] = user_id
+
+    async def get_owner(self, batch_id: str) -> Optional[str]:
+        return self._owners.get(batch_id)
+
+
+class RedisBatchJobStore(BatchJobStore):
+    """Redis-backed batch ownership, shared across workers"""
+
+    def __init__(self):
+        # Ownership lives in Redis; no in-memory dict
+        pass
+
+    @property
+    def redis(self):
+        """Resolved on use rather than kept, so it follows fork resets"""
+        return get_redis()
+
+    async def set_owner(self, batch_id: str, user_id: str) -> None:
+        await self.redis.set(f"batch_job:{batch_id}", user_id, ex=BATCH_JOB_TTL)
+
+    async def get_owner(self, batch_id: str) -> Optional[str]:
+        owner = await self.redis.get(f"batch_job:{batch_id}")
+        return owner.decode("utf-8") if owner is not None else None
+
+
+# Global store instance
+_store: Optional[BatchJobStore] = None
+
+
+def get_batch_job_store() -> BatchJobStore:
+    """Get the configured batch job store (singleton)"""
+    global _store
+    if _store is None:
+        if get_settings().STORAGE_BACKEND == "redis":
+            _store = RedisBatchJobStore()
+        else:
+            _store = BatchJobStore()
+    return _store
@@ -0,0 +1,95 @@
+"""
+Result Cache
+Content-addressed cache for expensive outputs (generated PDFs, LLM rewrites).
+Uses Redis when STORAGE_BACKEND=redis, process memory otherwise.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from app.core.config import get_settings
+from app.db.redis_client import get_redis
+
+
+def content_hash(*parts: Any) -> str:
+    """SHA-256 over the given values (bytes as-is, else as strings), used as a cache key suffix"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    In-memory TTL cache with a total size budget.
+    Least recently used entries are evicted once max_bytes is exceeded.
+    """
+
+    def __init__(self, ttl: int, max_bytes: int = 0):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._size = 0
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._evict(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        if key in self._entries:
+            self._evict(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._size += len(value)
+
+        while self.max_bytes and self._size > self.max_bytes and self._entries:
+            self._evict(next(iter(self._entries)))
+
+    def _evict(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self._size -= len(value)
+
+
+class RedisResultCache(ResultCache):
+    """Redis-backed TTL cache, shared across workers"""
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    @property
+    def redis(self):
+        """Shared client, looked up per call so a forked worker gets its own"""
+        return get_redis()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.redis.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        await self.redis.set(key, value, ex=self.ttl)
+
+
+# Global cache instance
+_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Get the configured result cache (singleton)"""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        if settings.STORAGE_BACKEND == "redis":
+            _cache = RedisResultCache(ttl=settings.CACHE_TTL_SECONDS)
+        else:
+            _cache = ResultCache(
+                ttl=settings.CACHE_TTL_SECONDS,
+                max_bytes=settings.CACHE_MAX_BYTES
+            )
+    return _cache
@@ -0,0 +1,37 @@
+"""
+Shared Redis connection
+"""
+import os
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    aioredis = None
+    REDIS_AVAILABLE = False
+
+from app.core.config import get_settings
+
+
+# Global client instance (holds its own connection pool)
+_redis = None
+
+
+def get_redis():
+    """Get the shared async Redis client (singleton)"""
+    global _redis
+    if _redis is None:
+        if not REDIS_AVAILABLE:
+            raise RuntimeError("redis package is not installed")
+        _redis = aioredis.from_url(get_settings().REDIS_URL)
+    return _redis
+
+
+def _reset_after_fork():
+    """Drop the inherited client in a forked child so it opens its own pool"""
+    global _redis
+    _redis = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
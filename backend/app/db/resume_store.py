@@ -0,0 +1,145 @@
+"""
+Resume Storage
+Backs the resume endpoints with either process memory or Redis.
+
+Redis layout:
+    resume:{resume_id}       HASH  {user_id, data: ResumeResponse JSON}
+    user:{uid}:resumes       SET   resume ids owned by the user
+"""
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.core.config import get_settings
+from app.db.redis_client import get_redis
+from app.schemas.resume import ResumeResponse
+
+
+class ResumeStore:
+    """In-memory resume store (single process, MVP default)"""
+
+    def __init__(self):
+        self._resumes: Dict[str, ResumeResponse] = {}
+        # Secondary index so listing is O(user's resumes), not O(all resumes)
+        self._by_user: Dict[str, Set[str]] = defaultdict(set)
+
+    async def get(self, resume_id: str) -> Optional[ResumeResponse]:
+        return self._resumes.get(resume_id)
+
+    async def put(self, resume: ResumeResponse) -> None:
+        self._resumes[resume.resume_id] = resume
+        self._by_user[resume.user_id].add(resume.resume_id)
+
+    async def delete(self, resume_id: str, user_id: str) -> None:
+        self._resumes.pop(resume_id, None)
+        self._by_user[user_id].discard(resume_id)
+
+    async def list_by_user(self, user_id: str) -> List[ResumeResponse]:
+        return [
+            self._resumes[resume_id]
+            for resume_id in self._by_user.get(user_id, ())
+        ]
+
+
+class RedisResumeStore(ResumeStore):
+    """Redis-backed resume store, shared across workers"""
+
+    # Upper bound on locally cached reads per worker
+    LOCAL_CACHE_MAX_SIZE = 4096
+
+    def __init__(self):
+        # Short-lived read-through cache of parsed reads. Writes through this
+        # worker invalidate it; writes via other workers show up within the TTL.
+        self.local_ttl = get_settings().RESUME_CACHE_TTL_SECONDS
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    @property
+    def redis(self):
+        """Not stored: get_redis() hands a forked worker a fresh pool"""
+        return get_redis()
+
+    def _local_get(self, key: str) -> Any:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._local[key]
+            return None
+        return entry[1]
+
+    def _local_set(self, key: str, value: Any) -> None:
+        if not self.local_ttl:
+            return
+        self._local[key] = (time.monotonic() + self.local_ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.LOCAL_CACHE_MAX_SIZE:
+            self._local.popitem(last=False)
+
+    def _local_invalidate(self, resume_id: str, user_id: str) -> None:
+        self._local.pop(f"resume:{resume_id}", None)
+        self._local.pop(f"user:{user_id}", None)
+
+    async def get(self, resume_id: str) -> Optional[ResumeResponse]:
+        cached = self._local_get(f"resume:{resume_id}")
+        if cached is not None:
+            return cached
+
+        payload = await self.redis.hget(f"resume:{resume_id}", "data")
+        if payload is None:
+            return None
+        resume = ResumeResponse.model_validate_json(payload)
+        self._local_set(f"resume:{resume_id}", resume)
+        return resume
+
+    async def put(self, resume: ResumeResponse) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(f"resume:{resume.resume_id}", mapping={
+                "user_id": resume.user_id,
+                "data": resume.model_dump_json(),
+            })
+            pipe.sadd(f"user:{resume.user_id}:resumes", resume.resume_id)
+            await pipe.execute()
+        self._local_invalidate(resume.resume_id, resume.user_id)
+
+    async def delete(self, resume_id: str, user_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(f"resume:{resume_id}")
+            pipe.srem(f"user:{user_id}:resumes", resume_id)
+            await pipe.execute()
+        self._local_invalidate(resume_id, user_id)
+
+    async def list_by_user(self, user_id: str) -> List[ResumeResponse]:
+        cached = self._local_get(f"user:{user_id}")
+        if cached is not None:
+            return cached
+
+        resume_ids = await self.redis.smembers(f"user:{user_id}:resumes")
+        if not resume_ids:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for resume_id in resume_ids:
+                pipe.hget(f"resume:{resume_id.decode()}", "data")
+            payloads = await pipe.execute()
+
+        resumes = [
+            ResumeResponse.model_validate_json(payload)
+            for payload in payloads if payload is not None
+        ]
+        self._local_set(f"user:{user_id}", resumes)
+        return resumes
+
+
+# Global store instance
+_store: Optional[ResumeStore] = None
+
+
+def get_resume_store() -> ResumeStore:
+    """Get the configured resume store (singleton)"""
+    global _store
+    if _store is None:
+        if get_settings().STORAGE_BACKEND == "redis":
+            _store = RedisResumeStore()
+        else:
+            _store = ResumeStore()
+    return _store
@@ -1,23 +1,26 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from app.core.clients import close_clients
 from app.core.config import get_settings
 from app.core.firebase import initialize_firebase
+from app.services.bullet_batcher import close_bullet_batcher
+from app.services.pdf_generator import get_pdf_pool, shutdown_pdf_pool
 from app.api import api_router
+from app.api.upload import get_pipeline
 
 
 # Initialize settings
 settings = get_settings()
 
-# Initialize Firebase
-initialize_firebase()
-
 # Create FastAPI app
 app = FastAPI(
     title="ResuMAX API",
     description="Production-grade resume optimization platform",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -33,6 +36,25 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api")
 
 
+@app.on_event("startup")
+async def startup():
+    """Initialize Firebase, the parsing pipeline and PDF workers before the first request"""
+    initialize_firebase()
+    get_pipeline()
+    get_pdf_pool()
+    if settings.DATABASE_WARM_POOL:
+        from app.core.database import warm_pool
+        await warm_pool()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Finish in-flight bullet batches, then close pooled connections and PDF workers"""
+    await close_bullet_batcher()
+    await close_clients()
+    shutdown_pdf_pool()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
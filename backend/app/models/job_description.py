@@ -1,9 +1,9 @@
 """
 Job Description Model
 """
-from sqlalchemy import Column, String, Text, JSON, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Boolean, Index, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 import uuid
 from app.core.database import Base
 
@@ -13,8 +13,8 @@ class JobDescription(Base):
 
     __tablename__ = "job_descriptions"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # Job info
     title = Column(String, nullable=False)
@@ -26,7 +26,7 @@ class JobDescription(Base):
     raw_description = Column(Text, nullable=False)
 
     # Parsed/analyzed data (from LLM)
-    parsed_data = Column(JSON, nullable=True)
+    parsed_data = Column(JSONB, nullable=True)
     # Contains: required_skills, preferred_skills, responsibilities, qualifications, keywords
 
     # Metadata
@@ -34,8 +34,16 @@ class JobDescription(Base):
     is_active = Column(Boolean, default=True, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # A user's active JDs, newest first, straight from index order
+    # (the leading user_id column also serves plain per-user lookups)
+    __table_args__ = (
+        Index("ix_jd_user_active_created", "user_id", "is_active", created_at.desc()),
+        # Containment queries (parsed_data @> '{"required_skills": [...]}')
+        Index("ix_jd_parsed_data", parsed_data, postgresql_using="gin"),
+    )
 
     # Relationships
     user = relationship("User", back_populates="job_descriptions")
@@ -1,8 +1,8 @@
 """
 Layout Models
 """
-from sqlalchemy import Column, String, JSON, DateTime, Boolean, Text
-from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Boolean, Text, Index, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 import uuid
 from app.core.database import Base
 
@@ -12,7 +12,7 @@ class LayoutTemplate(Base):
 
     __tablename__ = "layout_templates"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     # Template info
     name = Column(String, unique=True, nullable=False, index=True)  # e.g., "modern_tech"
@@ -20,7 +20,7 @@ class LayoutTemplate(Base):
     description = Column(Text, nullable=True)
 
     # Template configuration
-    config = Column(JSON, nullable=False)  # Default template settings
+    config = Column(JSONB, nullable=False)  # Default template settings
 
     # Metadata
     is_active = Column(Boolean, default=True, nullable=False)
@@ -28,8 +28,8 @@ class LayoutTemplate(Base):
     preview_image_url = Column(String, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     def __repr__(self):
         return f"<LayoutTemplate {self.display_name}>"
@@ -40,20 +40,25 @@ class LayoutConfiguration(Base):
 
     __tablename__ = "layout_configurations"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, nullable=False, index=True)  # Reference to user
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), nullable=False)  # Reference to user
 
     # Configuration
     name = Column(String, nullable=False)  # User-defined name
     template_name = Column(String, nullable=False)  # Base template
-    config = Column(JSON, nullable=False)  # Custom overrides
+    config = Column(JSONB, nullable=False)  # Custom overrides
 
     # Metadata
     is_default = Column(Boolean, default=False, nullable=False)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Covers per-user listing and the "user's default config" lookup
+    __table_args__ = (
+        Index("ix_layout_config_user_default", "user_id", "is_default"),
+    )
 
     def __repr__(self):
         return f"<LayoutConfiguration {self.name}>"
@@ -1,9 +1,9 @@
 """
 Optimization Session Model
 """
-from sqlalchemy import Column, String, JSON, DateTime, ForeignKey, Float, Text, Enum as SQLEnum
+from sqlalchemy import Column, DateTime, ForeignKey, Float, Text, Index, Enum as SQLEnum, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 import uuid
 import enum
 from app.core.database import Base
@@ -22,33 +22,39 @@ class OptimizationSession(Base):
 
     __tablename__ = "optimization_sessions"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    resume_id = Column(String, ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
-    job_description_id = Column(String, ForeignKey("job_descriptions.id", ondelete="SET NULL"), nullable=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
+    job_description_id = Column(UUID(as_uuid=True), ForeignKey("job_descriptions.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Status
     status = Column(SQLEnum(OptimizationStatus), default=OptimizationStatus.PENDING, nullable=False)
 
     # Input
-    original_resume = Column(JSON, nullable=False)  # Snapshot of resume at optimization time
-    target_job = Column(JSON, nullable=True)  # Job description data
+    original_resume = Column(JSONB, nullable=False)  # Snapshot of resume at optimization time
+    target_job = Column(JSONB, nullable=True)  # Job description data
 
     # Analysis results
     match_score = Column(Float, nullable=True)  # 0.0 - 1.0
-    analysis = Column(JSON, nullable=True)
+    analysis = Column(JSONB, nullable=True)
     # Contains: missing_keywords, strengths, weaknesses, recommendations
 
     # Optimized output
-    optimized_resume = Column(JSON, nullable=True)
-    changes_made = Column(JSON, nullable=True)  # List of changes applied
+    optimized_resume = Column(JSONB, nullable=True)
+    changes_made = Column(JSONB, nullable=True)  # List of changes applied
 
     # Error handling
     error_message = Column(Text, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    completed_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # A user's recent sessions, newest first, straight from index order
+    # (the leading user_id column also serves plain per-user lookups)
+    __table_args__ = (
+        Index("ix_opt_user_created", "user_id", created_at.desc()),
+    )
 
     # Relationships
     user = relationship("User", back_populates="optimization_sessions")
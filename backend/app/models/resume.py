@@ -1,9 +1,9 @@
 """
 Resume Models
 """
-from sqlalchemy import Column, String, JSON, DateTime, ForeignKey, Integer, Boolean, Text
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Boolean, Text, Index, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
 import uuid
 from app.core.database import Base
 
@@ -13,15 +13,15 @@ class Resume(Base):
 
     __tablename__ = "resumes"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Basic info
     name = Column(String, nullable=False)  # Resume name (e.g., "Software Engineer Resume")
     original_filename = Column(String, nullable=True)
 
     # Canonical JSON (single source of truth)
-    canonical_data = Column(JSON, nullable=False)
+    canonical_data = Column(JSONB, nullable=False)
 
     # Metadata
     file_path = Column(String, nullable=True)  # Original file path in storage
@@ -32,11 +32,17 @@ class Resume(Base):
     is_latest = Column(Boolean, default=True, nullable=False)
 
     # Layout configuration
-    layout_config = Column(JSON, nullable=True)  # User's layout preferences
+    layout_config = Column(JSONB, nullable=True)  # User's layout preferences
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    # "Latest resume for user": partial index holds only is_latest rows,
+    # so it stays small however many versions accumulate
+    __table_args__ = (
+        Index("ix_resumes_user_latest", "user_id", postgresql_where=is_latest.is_(True)),
+    )
 
     # Relationships
     user = relationship("User", back_populates="resumes")
@@ -52,23 +58,23 @@ class ResumeVersion(Base):
 
     __tablename__ = "resume_versions"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    resume_id = Column(String, ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Version info
     version_number = Column(Integer, nullable=False)
     change_description = Column(Text, nullable=True)
 
     # Snapshot of canonical data at this version
-    canonical_data = Column(JSON, nullable=False)
-    layout_config = Column(JSON, nullable=True)
+    canonical_data = Column(JSONB, nullable=False)
+    layout_config = Column(JSONB, nullable=True)
 
     # Generated outputs
     pdf_url = Column(String, nullable=True)
     docx_url = Column(String, nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     created_by = Column(String, nullable=True)  # User ID or "system" for auto-versions
 
     # Relationships
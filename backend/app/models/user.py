@@ -1,9 +1,10 @@
 """
 User Model
 """
-from sqlalchemy import Column, String, Boolean, DateTime, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from datetime import datetime, timezone
 import uuid
 from app.core.database import Base
 
@@ -13,7 +14,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     firebase_uid = Column(String, unique=True, nullable=False, index=True)
     email = Column(String, unique=True, nullable=False, index=True)
     display_name = Column(String, nullable=True)
@@ -23,16 +24,16 @@ class User(Base):
 
     # Subscription
     subscription_tier = Column(String, default="free")  # free, premium, enterprise
-    subscription_expires_at = Column(DateTime, nullable=True)
+    subscription_expires_at = Column(DateTime(timezone=True), nullable=True)
 
     # Usage limits
     resumes_created = Column(Integer, default=0)
     optimizations_used = Column(Integer, default=0)
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
-    last_login_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    last_login_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     resumes = relationship("Resume", back_populates="user", cascade="all, delete-orphan")
@@ -47,4 +48,4 @@ class User(Base):
         """Check if user has active subscription"""
         if not self.subscription_expires_at:
             return self.subscription_tier == "free"
-        return datetime.utcnow() < self.subscription_expires_at
+        return datetime.now(timezone.utc) < self.subscription_expires_at
@@ -12,6 +12,7 @@ from app.services.diff_engine import DiffEngine
 from app.services.one_page_engine import OnePageLayoutEngine
 from app.services.pdf_generator import ResumePDFGenerator
 from app.services.optimizer import OptimizationService
+from app.services.bullet_batcher import BulletBatcher
 
 __all__ = [
     "ResumeParserService",      # LLM-based resume parsing
@@ -20,4 +21,5 @@ __all__ = [
     "OnePageLayoutEngine",      # One-page layout compression
     "ResumePDFGenerator",       # PDF generation (ReportLab)
     "OptimizationService",      # Bullet optimization
+    "BulletBatcher",            # Micro-batching for bullet optimization
 ]
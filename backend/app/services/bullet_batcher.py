@@ -0,0 +1,150 @@
+"""
+Bullet Micro-Batcher
+Coalesces concurrent /optimize/bullet requests into shared completions.
+
+Requests arriving within BATCH_WINDOW_MS of each other (up to
+BATCH_MAX_SIZE) are sent to the LLM as one numbered prompt, and each
+caller gets its own bullet back. Cuts per-request round trips under load.
+"""
+import asyncio
+import os
+from typing import List, Optional, Set, Tuple
+
+from app.core.config import get_settings
+from app.services.optimizer import OptimizationService
+
+
+# (bullet, job_title, company, future)
+PendingBullet = Tuple[str, str, str, asyncio.Future]
+
+
+class BulletBatcher:
+    """
+    Queue + background drain task.
+    Started lazily on first submit so it binds to the running event loop.
+    """
+
+    def __init__(self, window_ms: int, max_size: int):
+        self.window = window_ms / 1000
+        self.max_size = max(1, max_size)
+        self.optimizer = OptimizationService()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # In-flight batches; the loop only keeps weak refs to tasks
+        self._tasks: Set[asyncio.Task] = set()
+        # Bullets taken off the queue by a cancelled _run, finished by close()
+        self._stranded: List[PendingBullet] = []
+
+    async def submit(self, bullet: str, job_title: str = "", company: str = "") -> str:
+        """Queue a bullet and wait for its optimized text"""
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((bullet, job_title, company, future))
+        return await future
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        """Drain the queue: wait for one item, then collect more until the window closes"""
+        loop = asyncio.get_running_loop()
+        batch: List[PendingBullet] = []
+        try:
+            while True:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.window
+
+                while len(batch) < self.max_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Don't block the next window on this batch's LLM call
+                self._spawn(batch)
+                batch = []
+        except asyncio.CancelledError:
+            # Hand a half-collected batch to close() along with the queue
+            self._stranded.extend(batch)
+            raise
+
+    def _spawn(self, batch: List[PendingBullet]):
+        task = asyncio.create_task(self._process(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """Stop collecting, then answer every in-flight and queued bullet (app shutdown)"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        # Callers awaiting these would otherwise hang; process what is left
+        stranded, self._stranded = self._stranded, []
+        while self._queue is not None and not self._queue.empty():
+            stranded.append(self._queue.get_nowait())
+        for i in range(0, len(stranded), self.max_size):
+            self._spawn(stranded[i:i + self.max_size])
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _process(self, batch: List[PendingBullet]):
+        try:
+            if len(batch) == 1:
+                bullet, job_title, company, _ = batch[0]
+                results = [await self.optimizer.optimize_bullet(bullet, job_title, company)]
+            else:
+                results = await self.optimizer.optimize_bullets([
+                    {"bullet": bullet, "job_title": job_title, "company": company}
+                    for bullet, job_title, company, _ in batch
+                ])
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# Global batcher instance
+_batcher: Optional[BulletBatcher] = None
+
+
+def get_bullet_batcher() -> BulletBatcher:
+    """Get the shared bullet batcher (singleton)"""
+    global _batcher
+    if _batcher is None:
+        settings = get_settings()
+        _batcher = BulletBatcher(
+            window_ms=settings.BATCH_WINDOW_MS,
+            max_size=settings.BATCH_MAX_SIZE
+        )
+    return _batcher
+
+
+def _reset_after_fork():
+    """Drop the inherited batcher: its queue, tasks and client belong to the parent"""
+    global _batcher
+    _batcher = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+async def close_bullet_batcher():
+    """Drain the shared batcher, if one was started (app shutdown)"""
+    global _batcher
+    if _batcher is not None:
+        await _batcher.close()
+    _batcher = None
@@ -6,6 +6,7 @@ This module is deterministic (no LLM) - pure text comparison.
 """
 from typing import List, Dict, Any
 from difflib import SequenceMatcher
+from operator import itemgetter
 from pydantic import BaseModel
 
 
@@ -187,7 +188,7 @@ class DiffEngine:
                 start = pos + 1
         
         # Sort by position
-        highlights.sort(key=lambda x: x["start"])
+        highlights.sort(key=itemgetter("start"))
         return highlights
 
 
@@ -3,18 +3,65 @@ Job Description Analysis Service
 Extracts keywords, identifies gaps, and analyzes alignment with resume.
 Uses GPT-4o-mini for cost optimization.
 """
+import logging
 import re
-from typing import List, Dict, Any
+from collections import Counter
+from typing import List, Dict, Any, Set, Tuple
 from pydantic import BaseModel
 
-try:
-    import openai
-    OPENAI_AVAILABLE = True
-except ImportError:
-    openai = None
-    OPENAI_AVAILABLE = False
+from app.core.clients import get_openai_client
+from app.db.cache import content_hash, get_result_cache
 
-from app.core.config import get_settings
+logger = logging.getLogger(__name__)
+
+
+# Common tech keywords for the no-LLM fallback, fused into one alternation
+# so the job description is scanned once instead of once per group
+TECH_KEYWORD_RE = re.compile(
+    r'\b('
+    r'Python|Java|JavaScript|TypeScript|React|Angular|Vue|Node\.js|Django|FastAPI|Flask'
+    r'|AWS|Azure|GCP|Docker|Kubernetes|CI/CD|Git|Jenkins'
+    r'|SQL|PostgreSQL|MongoDB|Redis|MySQL'
+    r'|Machine Learning|AI|NLP|Deep Learning|TensorFlow|PyTorch'
+    r')\b',
+    re.IGNORECASE
+)
+
+
+# Word pieces of tech terms: "+" and "#" stay in (c++, c#) and a leading
+# dot stays attached (".net", the ".js" of "node.js"); "/" and "-" split
+WORD_RE = re.compile(r"\.?[a-z0-9+#]+")
+
+
+def term_key(text: str) -> Tuple[str, ...]:
+    """Split text into lowercased word pieces: "Node.js" -> ("node", ".js")"""
+    return tuple(WORD_RE.findall(text.lower()))
+
+
+def term_set(pieces: Tuple[str, ...], keys: List[Tuple[str, ...]]) -> Set[Tuple[str, ...]]:
+    """
+    Terms of a tokenized text that the given term_key()s can match.
+
+    Single pieces also match without a leading dot or trailing version
+    digits, so "react" matches "react.js" and "python" matches "python3".
+    Multi-word runs are only built where one of the keys starts.
+    """
+    unique = set(pieces)
+    terms = {(piece,) for piece in unique}
+    for piece in unique:
+        bare = piece.lstrip(".")
+        terms.add((bare,))
+        terms.add((bare.rstrip("0123456789") or bare,))
+
+    lengths_by_start: Dict[str, Set[int]] = {}
+    for key in keys:
+        if len(key) > 1:
+            lengths_by_start.setdefault(key[0], set()).add(len(key))
+    if lengths_by_start:
+        for i, piece in enumerate(pieces):
+            for n in lengths_by_start.get(piece, ()):
+                terms.add(pieces[i:i + n])
+    return terms
 
 
 class JobAnalysisResult(BaseModel):
@@ -41,21 +88,25 @@ class JobAnalyzer:
     Uses GPT-4o-mini for cost-effective analysis.
     """
     
-    def __init__(self):
-        settings = get_settings()
-        self.api_key = settings.OPENAI_API_KEY if hasattr(settings, 'OPENAI_API_KEY') else None
-        
-        if self.api_key and OPENAI_AVAILABLE:
-            openai.api_key = self.api_key
+    def __init__(self, client=None):
+        # Shared pooled client unless one is injected
+        self.client = client or get_openai_client()
+        # LLM results are cached by content hash; identical inputs skip the call
+        self.cache = get_result_cache()
     
     async def analyze_job_description(self, job_description: str) -> JobAnalysisResult:
         """
         Extract key information from job description.
         Uses GPT-4o-mini for cost optimization.
         """
-        if not OPENAI_AVAILABLE or not self.api_key:
+        if not self.client:
             # Fallback: basic keyword extraction
             return self._extract_keywords_basic(job_description)
+
+        cache_key = "job_analysis:" + content_hash(job_description)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return JobAnalysisResult.model_validate_json(cached)
         
         # ROAST Framework Prompt
         system_prompt = """ROLE: You are a technical recruiter and job market analyst with expertise in parsing job descriptions to extract critical hiring signals.
@@ -93,7 +144,7 @@ Return ONLY valid JSON matching this exact schema:
 }"""
 
         try:
-            response = openai.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",  # Cost-optimized model
                 messages=[
                     {"role": "system", "content": system_prompt + schema_instruction},
@@ -104,11 +155,12 @@ Return ONLY valid JSON matching this exact schema:
             )
             
             import json
-            result = json.loads(response.choices[0].message.content)
-            return JobAnalysisResult(**result)
+            result = JobAnalysisResult(**json.loads(response.choices[0].message.content))
+            await self.cache.set(cache_key, result.model_dump_json().encode("utf-8"))
+            return result
             
         except Exception as e:
-            print(f"LLM analysis failed: {e}, falling back to basic extraction")
+            logger.warning("LLM analysis failed: %s, falling back to basic extraction", e)
             return self._extract_keywords_basic(job_description)
     
     async def analyze_resume_gaps(
@@ -120,8 +172,13 @@ Return ONLY valid JSON matching this exact schema:
         Compare resume against job requirements.
         Identify missing keywords and weak bullets.
         """
-        if not OPENAI_AVAILABLE or not self.api_key:
+        if not self.client:
             return self._analyze_gaps_basic(resume_text, job_analysis)
+
+        cache_key = "gap_analysis:" + content_hash(resume_text, job_analysis.model_dump_json())
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return ResumeGapAnalysis.model_validate_json(cached)
         
         # ROAST Framework Prompt
         system_prompt = """ROLE: You are a senior career coach and resume strategist who helps candidates identify gaps between their resume and job requirements, providing actionable improvement recommendations.
@@ -164,7 +221,7 @@ Resume:
 {resume_text}"""
 
         try:
-            response = openai.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": system_prompt + schema_instruction},
@@ -175,32 +232,27 @@ Resume:
             )
             
             import json
-            result = json.loads(response.choices[0].message.content)
-            return ResumeGapAnalysis(**result)
+            result = ResumeGapAnalysis(**json.loads(response.choices[0].message.content))
+            await self.cache.set(cache_key, result.model_dump_json().encode("utf-8"))
+            return result
             
         except Exception as e:
-            print(f"Gap analysis failed: {e}")
+            logger.warning("Gap analysis failed: %s, falling back to basic matching", e)
             return self._analyze_gaps_basic(resume_text, job_analysis)
     
     def _extract_keywords_basic(self, text: str) -> JobAnalysisResult:
         """Fallback: basic keyword extraction using regex and heuristics"""
-        lines = text.split('\n')
-        
-        # Common tech keywords
-        tech_patterns = [
-            r'\b(Python|Java|JavaScript|TypeScript|React|Angular|Vue|Node\.js|Django|FastAPI|Flask)\b',
-            r'\b(AWS|Azure|GCP|Docker|Kubernetes|CI/CD|Git|Jenkins)\b',
-            r'\b(SQL|PostgreSQL|MongoDB|Redis|MySQL)\b',
-            r'\b(Machine Learning|AI|NLP|Deep Learning|TensorFlow|PyTorch)\b',
-        ]
-        
-        keywords = set()
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            keywords.update(matches)
+        # Rank by mention count (ties keep first-seen order) and fold case
+        # variants, so the top 10 are the JD's most emphasised keywords
+        counts = Counter()
+        surface = {}
+        for match in TECH_KEYWORD_RE.findall(text):
+            key = match.lower()
+            counts[key] += 1
+            surface.setdefault(key, match)
         
         return JobAnalysisResult(
-            required_keywords=list(keywords)[:10],
+            required_keywords=[surface[key] for key, _ in counts.most_common(10)],
             preferred_keywords=[],
             missing_skills=[],
             role_level="Mid",
@@ -214,11 +266,12 @@ Resume:
         job_analysis: JobAnalysisResult
     ) -> ResumeGapAnalysis:
         """Fallback: basic gap analysis"""
-        resume_lower = resume_text.lower()
-        
+        # Tokenize the resume once, then each keyword is a set lookup
+        keys = [term_key(keyword) for keyword in job_analysis.required_keywords]
+        resume_terms = term_set(term_key(resume_text), keys)
         missing = [
-            keyword for keyword in job_analysis.required_keywords
-            if keyword.lower() not in resume_lower
+            keyword for keyword, key in zip(job_analysis.required_keywords, keys)
+            if key not in resume_terms
         ]
         
         return ResumeGapAnalysis(
@@ -10,7 +10,7 @@ from .primitives import Block, Row, Column, Text, BulletList
 from .templates import TEMPLATES, ModernTechTemplate
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionedElement:
     """
     Element with exact position on page
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import List, Literal, Union
 
 
-@dataclass
+@dataclass(slots=True)
 class Text:
     """
     Text primitive with font metrics
@@ -20,7 +20,7 @@ class Text:
     color: str = "#000000"
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """
     Column in a Row
@@ -37,7 +37,7 @@ class Column:
             self.children = []
 
 
-@dataclass
+@dataclass(slots=True)
 class Row:
     """
     Horizontal grouping of columns
@@ -47,7 +47,7 @@ class Row:
     margin_bottom: float = 0.0  # Space after row
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     """
     Vertical stack of items (Rows or Text)
@@ -62,7 +62,7 @@ class Block:
             self.children = [self.children]
 
 
-@dataclass
+@dataclass(slots=True)
 class BulletList:
     """
     Special block for bullet points
@@ -3,12 +3,16 @@ LLM-powered resume parser using OpenAI GPT-4
 More accurate than regex-based parsing
 """
 import json
+import logging
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+from app.core.clients import get_openai_client
 from app.core.config import get_settings
 from app.schemas.resume import Resume
 
+logger = logging.getLogger(__name__)
+
 # Optional imports
 try:
     import openai
@@ -39,6 +43,51 @@ except ImportError:
     DOCX_AVAILABLE = False
 
 
+# Line classification tables, compiled once at import (hot in _parse_basic)
+BULLET_CHARS = ('•', '●', '-', '*', '○', '▪', '▫', '■', '□', '◦', '‣', '⁃', '▸', '▹', '►', '▻')
+
+NUMBERED_BULLET_RE = re.compile(r'^\d+\.\s')
+
+ACTION_VERBS = frozenset({
+    'built', 'developed', 'created', 'designed', 'implemented', 'led', 'managed',
+    'improved', 'increased', 'reduced', 'achieved', 'delivered', 'launched',
+    'established', 'optimized', 'automated', 'collaborated', 'coordinated',
+    'spearheaded', 'architected', 'engineered', 'executed', 'analyzed',
+    'researched', 'integrated', 'migrated', 'deployed', 'configured',
+    'maintained', 'supported', 'troubleshot', 'resolved', 'enhanced'
+})
+
+# Section header keyword variations, in priority order
+SECTION_KEYWORDS = {
+    'EXPERIENCE': r'EXPERIENCE|WORK EXPERIENCE|EMPLOYMENT|WORK HISTORY|PROFESSIONAL EXPERIENCE',
+    'EDUCATION': r'EDUCATION|ACADEMIC|DEGREES?|ACADEMIC BACKGROUND',
+    'SKILLS': r'SKILLS|TECHNICAL SKILLS|TECHNOLOGIES|COMPETENCIES|EXPERTISE',
+    'PROJECTS': r'PROJECTS?|PORTFOLIO|NOTABLE PROJECTS?',
+    'CERTIFICATIONS': r'CERTIFICATIONS?|LICENSES?|CREDENTIALS?',
+    'AWARDS': r'AWARDS?|HONORS?|ACHIEVEMENTS?|RECOGNITION',
+    'SUMMARY': r'SUMMARY|PROFESSIONAL SUMMARY|PROFILE|OBJECTIVE',
+}
+SECTION_PRIORITY = {section: rank for rank, section in enumerate(SECTION_KEYWORDS)}
+
+# All sections fused into one alternation; the named group that matched
+# identifies the section, so a line is scanned once instead of per section
+SECTION_HEADER_RE = re.compile(
+    r'\b(?:' + '|'.join(
+        f'(?P<{section}>{keywords})' for section, keywords in SECTION_KEYWORDS.items()
+    ) + r')\b'
+)
+
+# Keyword probes for entry headers: one compiled case-insensitive search per
+# line instead of lowercasing the line and testing each keyword in turn
+MONTH_ABBR_RE = re.compile(r'JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC', re.IGNORECASE)
+TECH_HINT_RE = re.compile(r'python|java|react|node|javascript|typescript|c\+\+|go|rust', re.IGNORECASE)
+DEGREE_ABBR_RE = re.compile(r'bachelor|master|phd|b\.s\.|m\.s\.|b\.a\.|m\.a\.', re.IGNORECASE)
+DEGREE_KEYWORD_RE = re.compile(
+    r'bachelor|master|phd|ph\.d|b\.s\.|m\.s\.|b\.a\.|m\.a\.|associate|doctorate|diploma',
+    re.IGNORECASE
+)
+
+
 class LLMResumeParser:
     """
     Use GPT-4 to extract structured resume data from text.
@@ -52,7 +101,7 @@ class LLMResumeParser:
         if self.api_key and OPENAI_AVAILABLE:
             openai.api_key = self.api_key
         elif self.api_key and not OPENAI_AVAILABLE:
-            print("Warning: OPENAI_API_KEY set but 'openai' module not installed.")
+            logger.warning("OPENAI_API_KEY set but 'openai' module not installed")
 
     async def parse_file(self, file_path: Path, filename: str) -> Resume:
         """Parse resume file using LLM extraction"""
@@ -61,7 +110,7 @@ class LLMResumeParser:
 
         if extension == ".pdf":
             text = await self._extract_pdf(file_path)
-        elif extension in [".docx", ".doc"]:
+        elif extension in (".docx", ".doc"):
             text = await self._extract_docx(file_path)
         elif extension == ".txt":
             text = await self._extract_txt(file_path)
@@ -76,10 +125,10 @@ class LLMResumeParser:
             try:
                 return await self._parse_with_llm(text)
             except Exception as e:
-                print(f"LLM parsing failed: {e}, falling back to regex parser")
+                logger.warning("LLM parsing failed: %s, falling back to regex parser", e)
                 return await self._parse_basic(text)
         else:
-            print("LLM parsing not available, using regex-based parser")
+            logger.debug("LLM parsing not available, using regex-based parser")
             return await self._parse_basic(text)
 
     async def _extract_pdf(self, file_path: Path) -> str:
@@ -100,7 +149,7 @@ class LLMResumeParser:
                 # Just return the text as-is to preserve spatial relationships
                 return full_text
             except Exception as e:
-                print(f"PyMuPDF extraction failed: {e}, falling back to pypdf")
+                logger.warning("PyMuPDF extraction failed: %s, falling back to pypdf", e)
 
         # Fallback to pypdf
         if not PYPDF_AVAILABLE:
@@ -165,33 +214,59 @@ class LLMResumeParser:
         if not line_stripped:
             return False
 
+        return self._is_bullet_text(line_stripped) or self._is_indented_item(line)
+
+    def _is_bullet_text(self, line_stripped: str) -> bool:
+        """Bullet checks that only look at the (non-empty, stripped) text"""
         # Strategy 1: Bullet characters
-        bullet_chars = ['•', '●', '-', '*', '○', '▪', '▫', '■', '□', '◦', '‣', '⁃', '▸', '▹', '►', '▻']
-        if any(line_stripped.startswith(char) for char in bullet_chars):
+        if line_stripped.startswith(BULLET_CHARS):
             return True
 
         # Strategy 2: Numbered bullets (1. 2. 3.)
-        if re.match(r'^\d+\.\s', line_stripped):
+        if NUMBERED_BULLET_RE.match(line_stripped):
             return True
 
-        # Strategy 3: Indented lines (4+ spaces or tab) - but not section headers
-        if (line.startswith('    ') or line.startswith('\t')) and not self._detect_section(line):
-            return True
+        # Strategy 3: Action verbs (common resume action verbs)
+        # Checked before indentation: an O(1) set hit settles the line
+        # without running the section-header regex below
+        first_word = line_stripped.split(None, 1)[0].lower()
+        return first_word in ACTION_VERBS
 
-        # Strategy 4: Action verbs (common resume action verbs)
-        action_verbs = [
-            'built', 'developed', 'created', 'designed', 'implemented', 'led', 'managed',
-            'improved', 'increased', 'reduced', 'achieved', 'delivered', 'launched',
-            'established', 'optimized', 'automated', 'collaborated', 'coordinated',
-            'spearheaded', 'architected', 'engineered', 'executed', 'analyzed',
-            'researched', 'integrated', 'migrated', 'deployed', 'configured',
-            'maintained', 'supported', 'troubleshot', 'resolved', 'enhanced'
-        ]
-        first_word = line_stripped.split()[0].lower() if line_stripped.split() else ""
-        if first_word in action_verbs:
-            return True
+    def _is_indented_item(self, line: str) -> bool:
+        """Strategy 4: Indented lines (4+ spaces or tab) - but not section headers"""
+        return (line.startswith('    ') or line.startswith('\t')) and not self._detect_section(line)
 
-        return False
+    def _collect_bullets(self, raw_lines: List[str], lines: List[str]) -> Tuple[List[str], List[bool]]:
+        """
+        Classify a block's lines in one pass.
+
+        lines must be the stripped non-empty raw_lines. Returns
+        (bullet_lines, line_is_bullet) where line_is_bullet[i] is the bullet
+        flag for lines[i], so callers can reuse it instead of re-running
+        _is_bullet_point on the same line.
+        """
+        bullet_lines = []
+        line_is_bullet = []
+        for i, raw_line in enumerate(raw_lines):
+            line_stripped = raw_line.strip()
+            if not line_stripped:
+                continue
+
+            # Indentation is gone once stripped, so the text checks alone
+            # are the flag for this line's entry in lines
+            is_bullet_text = self._is_bullet_text(line_stripped)
+            line_is_bullet.append(is_bullet_text)
+            if is_bullet_text or self._is_indented_item(raw_line):
+                bullet_lines.append(lines[min(i, len(lines)-1)] if i < len(lines) else line_stripped)
+
+        # Also check in stripped lines
+        seen = set(bullet_lines)
+        for line, is_bullet in zip(lines, line_is_bullet):
+            if is_bullet and line not in seen:
+                bullet_lines.append(line)
+                seen.add(line)
+
+        return bullet_lines, line_is_bullet
 
     def _detect_section(self, line: str) -> Optional[str]:
         """
@@ -200,37 +275,17 @@ class LLMResumeParser:
         """
         line_clean = line.strip().upper()
 
-        # Section patterns with variations
-        section_patterns = {
-            'EXPERIENCE': [
-                r'\b(EXPERIENCE|WORK EXPERIENCE|EMPLOYMENT|WORK HISTORY|PROFESSIONAL EXPERIENCE)\b',
-            ],
-            'EDUCATION': [
-                r'\b(EDUCATION|ACADEMIC|DEGREES?|ACADEMIC BACKGROUND)\b',
-            ],
-            'SKILLS': [
-                r'\b(SKILLS|TECHNICAL SKILLS|TECHNOLOGIES|COMPETENCIES|EXPERTISE)\b',
-            ],
-            'PROJECTS': [
-                r'\b(PROJECTS?|PORTFOLIO|NOTABLE PROJECTS?)\b',
-            ],
-            'CERTIFICATIONS': [
-                r'\b(CERTIFICATIONS?|LICENSES?|CREDENTIALS?)\b',
-            ],
-            'AWARDS': [
-                r'\b(AWARDS?|HONORS?|ACHIEVEMENTS?|RECOGNITION)\b',
-            ],
-            'SUMMARY': [
-                r'\b(SUMMARY|PROFESSIONAL SUMMARY|PROFILE|OBJECTIVE)\b',
-            ]
-        }
-
-        for section_type, patterns in section_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, line_clean):
-                    return section_type
+        # Single pass over the line; on multiple hits keep the
+        # highest-priority section (same result as checking in order)
+        best = None
+        for match in SECTION_HEADER_RE.finditer(line_clean):
+            section_type = match.lastgroup
+            if best is None or SECTION_PRIORITY[section_type] < SECTION_PRIORITY[best]:
+                best = section_type
+                if SECTION_PRIORITY[best] == 0:
+                    break
 
-        return None
+        return best
 
     def _split_header_line(self, line: str) -> tuple:
         """
@@ -417,10 +472,9 @@ CRITICAL REQUIREMENTS:
 7. DO NOT use special Unicode characters like zero-width spaces in bullets"""
 
         try:
-            # Use AsyncOpenAI for async support
-            from openai import AsyncOpenAI
-            client = AsyncOpenAI(api_key=self.api_key)
-            
+            # Shared pooled AsyncOpenAI client
+            client = get_openai_client()
+
             response = await client.chat.completions.create(
                 model="gpt-4-turbo",
                 messages=[
@@ -471,19 +525,15 @@ CRITICAL REQUIREMENTS:
             # Validate and convert to Resume schema
             return Resume(**parsed_data)
             
-        except Exception as e:
-            print(f"LLM parsing error: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("LLM parsing error")
             raise
 
     async def _parse_basic(self, text: str) -> Resume:
         """GENERALIZABLE resume parser - works with many formats"""
         lines = [line.strip() for line in text.split("\n") if line.strip()]
 
-        print("DEBUG: First 1000 chars of extracted text:")
-        print(text[:1000])
-        print("=" * 50)
+        logger.debug("First 1000 chars of extracted text:\n%s", text[:1000])
 
         resume_data = {
             "header": {
@@ -544,7 +594,7 @@ CRITICAL REQUIREMENTS:
             next_section = re.search(r'\n(EDUCATION|SKILLS|PROJECTS|CERTIFICATIONS)', text[exp_start:], re.IGNORECASE)
             exp_text = text[exp_start:exp_start + next_section.start()] if next_section else text[exp_start:exp_start+6000]
 
-            print(f"DEBUG: Experience section length: {len(exp_text)} chars")
+            logger.debug("Experience section length: %d chars", len(exp_text))
 
             # Split by double line breaks to separate jobs
             job_blocks = re.split(r'\n\s*\n', exp_text)
@@ -558,24 +608,16 @@ CRITICAL REQUIREMENTS:
                 raw_lines = block.split('\n')
                 lines = [l.strip() for l in raw_lines if l.strip()]
 
-                # Use multi-strategy bullet detection
-                bullet_lines = []
-                for i, raw_line in enumerate(raw_lines):
-                    if self._is_bullet_point(raw_line):
-                        bullet_lines.append(lines[min(i, len(lines)-1)] if i < len(lines) else raw_line.strip())
-
-                # Also check in stripped lines
-                for line in lines:
-                    if self._is_bullet_point(line) and line not in bullet_lines:
-                        bullet_lines.append(line)
+                # Use multi-strategy bullet detection (each line classified once)
+                bullet_lines, line_is_bullet = self._collect_bullets(raw_lines, lines)
 
                 if not bullet_lines:  # No bullets means not a job entry
                     continue
 
                 # Extract job metadata from lines BEFORE bullets
                 header_lines = []
-                for l in lines:
-                    if self._is_bullet_point(l):
+                for l, is_bullet in zip(lines, line_is_bullet):
+                    if is_bullet:
                         break
                     header_lines.append(l)
 
@@ -594,7 +636,7 @@ CRITICAL REQUIREMENTS:
                 # Step 1: Find company (usually all caps or first line)
                 for idx, line in enumerate(header_lines):
                     if line.isupper() and len(line) > 2:
-                        if not any(month in line.upper() for month in ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']):
+                        if not MONTH_ABBR_RE.search(line):
                             company = line
                             used_lines.add(idx)
                             break
@@ -675,7 +717,7 @@ CRITICAL REQUIREMENTS:
                         "technologies": []
                     }
                     resume_data["experience"].append(job_entry)
-                    print(f"DEBUG: Added job: {company} - {title} (Location: {location}) with {len(clean_bullets)} bullets")
+                    logger.debug("Added job: %s - %s (Location: %s) with %d bullets", company, title, location, len(clean_bullets))
 
         # GENERALIZABLE PROJECTS PARSING with multi-strategy bullet detection
         proj_pattern = r'(PROJECTS?|PORTFOLIO|NOTABLE PROJECTS?)'
@@ -686,18 +728,12 @@ CRITICAL REQUIREMENTS:
             next_section = re.search(r'\n(EDUCATION|SKILLS|CERTIFICATIONS|AWARDS|EXPERIENCE)', text[proj_start:], re.IGNORECASE)
             proj_text = text[proj_start:proj_start + next_section.start()] if next_section else text[proj_start:proj_start+4000]
 
-            print(f"DEBUG: Projects section length: {len(proj_text)} chars")
-            try:
-                print(f"DEBUG: Projects section first 500 chars (repr):\n{repr(proj_text[:500])}")
-            except Exception as e:
-                print(f"DEBUG: Error printing projects text: {e}")
+            logger.debug("Projects section length: %d chars", len(proj_text))
+            logger.debug("Projects section first 500 chars (repr):\n%r", proj_text[:500])
 
             # Split by paragraphs to separate projects
             proj_blocks = re.split(r'\n\s*\n', proj_text)
-            print(f"DEBUG: Found {len(proj_blocks)} project blocks after splitting")
-
-            if len(proj_blocks) == 0:
-                print("DEBUG: ERROR - No project blocks found after splitting!")
+            logger.debug("Found %d project blocks after splitting", len(proj_blocks))
 
             for block_idx, block in enumerate(proj_blocks):
                 if not block.strip():
@@ -706,27 +742,19 @@ CRITICAL REQUIREMENTS:
                 raw_lines = block.split('\n')
                 lines = [l.strip() for l in raw_lines if l.strip()]
 
-                # Use multi-strategy bullet detection
-                bullet_lines = []
-                for i, raw_line in enumerate(raw_lines):
-                    if self._is_bullet_point(raw_line):
-                        bullet_lines.append(lines[min(i, len(lines)-1)] if i < len(lines) else raw_line.strip())
-
-                # Also check in stripped lines
-                for line in lines:
-                    if self._is_bullet_point(line) and line not in bullet_lines:
-                        bullet_lines.append(line)
+                # Use multi-strategy bullet detection (each line classified once)
+                bullet_lines, line_is_bullet = self._collect_bullets(raw_lines, lines)
 
-                print(f"DEBUG: Project block {block_idx}: {len(lines)} lines, {len(bullet_lines)} bullets")
+                logger.debug("Project block %d: %d lines, %d bullets", block_idx, len(lines), len(bullet_lines))
                 if not lines:
-                    print(f"DEBUG: Skipping block {block_idx} - no lines")
+                    logger.debug("Skipping block %d - no lines", block_idx)
                     continue
 
                 # Projects might not have bullets - could just be name + description
                 # Extract project header - if ALL lines are bullets, treat first line as header
                 header_lines = []
-                for l in lines:
-                    if self._is_bullet_point(l):
+                for l, is_bullet in zip(lines, line_is_bullet):
+                    if is_bullet:
                         break
                     header_lines.append(l)
 
@@ -736,9 +764,9 @@ CRITICAL REQUIREMENTS:
                     # Remove first line from bullet_lines since it's the project name
                     if bullet_lines and bullet_lines[0] == lines[0]:
                         bullet_lines = bullet_lines[1:]
-                    print(f"DEBUG: Project block {block_idx} - using first line as header: {lines[0][:50]}")
+                    logger.debug("Project block %d - using first line as header: %s", block_idx, lines[0][:50])
                 elif not header_lines:
-                    print(f"DEBUG: Skipping block {block_idx} - no header lines and no lines at all")
+                    logger.debug("Skipping block %d - no header lines and no lines at all", block_idx)
                     continue
 
                 # First line is usually: "Project Name | Tech1, Tech2, Tech3" or "Project Name (url)"
@@ -779,7 +807,7 @@ CRITICAL REQUIREMENTS:
                 if not technologies and len(header_lines) > 1:
                     second_line = header_lines[1]
                     # If second line looks like a tech list (has commas or common tech keywords)
-                    if ',' in second_line or any(tech in second_line.lower() for tech in ['python', 'java', 'react', 'node', 'javascript', 'typescript', 'c++', 'go', 'rust']):
+                    if ',' in second_line or TECH_HINT_RE.search(second_line):
                         technologies = [t.strip() for t in re.split(r'[,;]', second_line) if t.strip()]
                     else:
                         # It's a description
@@ -797,7 +825,10 @@ CRITICAL REQUIREMENTS:
                         clean_bullets.append(clean[:500])
 
                 # Add project if we have meaningful content
-                print(f"DEBUG: Project block {block_idx} evaluation - bullets: {len(clean_bullets)}, description: {bool(description)}, header_lines: {len(header_lines)}, name: {project_name[:50] if project_name else 'NONE'}")
+                logger.debug(
+                    "Project block %d evaluation - bullets: %d, description: %s, header_lines: %d, name: %s",
+                    block_idx, len(clean_bullets), bool(description), len(header_lines), project_name[:50] or "NONE"
+                )
                 if clean_bullets or description or len(header_lines) > 1:
                     project_entry = {
                         "name": project_name[:100],
@@ -809,9 +840,9 @@ CRITICAL REQUIREMENTS:
                         "technologies": technologies[:20]
                     }
                     resume_data["projects"].append(project_entry)
-                    print(f"DEBUG: Added project: {project_name} with {len(clean_bullets)} bullets, {len(technologies)} techs")
+                    logger.debug("Added project: %s with %d bullets, %d techs", project_name, len(clean_bullets), len(technologies))
                 else:
-                    print(f"DEBUG: Skipping project block {block_idx} - no bullets, no description, only 1 header line")
+                    logger.debug("Skipping project block %d - no bullets, no description, only 1 header line", block_idx)
 
         # GENERALIZABLE SKILLS PARSING
         skills_pattern = r'(SKILLS|TECHNICAL SKILLS|TECHNOLOGIES|COMPETENCIES|EXPERTISE)'
@@ -885,23 +916,22 @@ CRITICAL REQUIREMENTS:
                 for idx, line in enumerate(edu_lines):
                     if line.isupper() and len(line) > 3:
                         # Make sure it's not a date or degree line
-                        if not any(keyword in line.lower() for keyword in ['bachelor', 'master', 'phd', 'b.s.', 'm.s.', 'b.a.', 'm.a.']) and not re.search(r'\d{4}', line):
+                        if not DEGREE_ABBR_RE.search(line) and not re.search(r'\d{4}', line):
                             institution = line
                             used_line_indices.add(idx)
                             break
 
                 if not institution and edu_lines:
                     # First line is likely institution if it's not a degree line
-                    if not any(keyword in edu_lines[0].lower() for keyword in ['bachelor', 'master', 'phd', 'b.s.', 'm.s.', 'b.a.', 'm.a.']):
+                    if not DEGREE_ABBR_RE.search(edu_lines[0]):
                         institution = edu_lines[0]
                         used_line_indices.add(0)
 
                 # Find degree (often has "Bachelor", "Master", "PhD", "B.S.", "M.S.", etc.)
-                degree_keywords = ['bachelor', 'master', 'phd', 'ph.d', 'b.s.', 'm.s.', 'b.a.', 'm.a.', 'associate', 'doctorate', 'diploma']
                 for idx, line in enumerate(edu_lines):
                     if idx in used_line_indices:
                         continue
-                    if any(keyword in line.lower() for keyword in degree_keywords):
+                    if DEGREE_KEYWORD_RE.search(line):
                         # Check if field is in same line (e.g., "Bachelor of Science in Computer Science")
                         if ' in ' in line.lower():
                             # Split on ' in ' (case-insensitive)
@@ -954,11 +984,11 @@ CRITICAL REQUIREMENTS:
                     "coursework": []
                 })
 
-        print(f"\nDEBUG: Final parsing results:")
-        print(f"  - Experience items: {len(resume_data['experience'])}")
-        print(f"  - Projects: {len(resume_data['projects'])}")
-        print(f"  - Skills categories: {len(resume_data['skills'])}")
-        print(f"  - Education items: {len(resume_data['education'])}")
+        logger.debug(
+            "Final parsing results: %d experience items, %d projects, %d skills categories, %d education items",
+            len(resume_data["experience"]), len(resume_data["projects"]),
+            len(resume_data["skills"]), len(resume_data["education"])
+        )
 
         return Resume(**resume_data)
 
@@ -3,16 +3,85 @@ Simple Bullet Optimizer
 AI-powered bullet point improvement using GPT-4.
 Standalone, no complex dependencies.
 """
+import asyncio
 import json
-from typing import Optional
+import logging
+from typing import Any, Dict, List, Optional
 
 try:
-    from openai import AsyncOpenAI
+    from openai import RateLimitError
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
 
+from app.core.clients import get_openai_client
 from app.core.config import get_settings
+from app.db.cache import content_hash, get_result_cache
+
+logger = logging.getLogger(__name__)
+
+# In-flight chunk completions, capped for the whole process so concurrent
+# optimize requests share one limit instead of each bringing their own
+_chunk_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_chunk_semaphore() -> asyncio.Semaphore:
+    """Get the process-wide chunk completion semaphore (singleton)"""
+    global _chunk_semaphore
+    if _chunk_semaphore is None:
+        _chunk_semaphore = asyncio.Semaphore(get_settings().OPENAI_MAX_CONCURRENCY)
+    return _chunk_semaphore
+
+
+# ROAST Framework Prompt for Single Bullet Optimization
+BULLET_SYSTEM_PROMPT = """ROLE: You are an expert resume writer and career coach with 15+ years of experience helping professionals land their dream jobs at top tech companies.
+
+OBJECTIVE: Transform a resume bullet point into a highly impactful, ATS-friendly statement that showcases quantifiable achievements and demonstrates clear business value.
+
+AUDIENCE: Your output will be read by:
+- Applicant Tracking Systems (ATS) that scan for keywords and metrics
+- Recruiters who spend 6-10 seconds per resume
+- Hiring managers looking for specific achievements and impact
+
+STYLE:
+- Use STAR method (Situation, Task, Action, Result) structure
+- Start with strong action verbs (Led, Engineered, Architected, Optimized, etc.)
+- Include specific, quantifiable metrics (numbers, percentages, scale)
+- CRITICAL: Maintain similar character count to the original (within 10 characters) to preserve resume layout
+- If original is ~100 chars, optimized should be ~100 chars (not 150 chars)
+- Use industry-standard terminology and keywords
+- Format: Single sentence, no bullet character, professional tone
+- DO NOT add excessive wordiness that would break single-page layout
+
+TONE: Confident, professional, achievement-focused. Sound like a top performer who delivers measurable results.
+
+LAYOUT CONSTRAINT: The optimized bullet MUST maintain approximately the same length as the original to preserve the one-page resume format. If you make it significantly longer, it will break the layout."""
+
+
+# ROAST Framework Prompt for Full Resume Optimization
+RESUME_SYSTEM_PROMPT = """ROLE: You are a senior resume optimization specialist who helps job seekers tailor their resumes to specific job descriptions, increasing their interview rate by 3-5x.
+
+OBJECTIVE: Analyze the job description and optimize resume bullet points to:
+1. Incorporate relevant keywords from the job description
+2. Align achievements with the role's requirements
+3. Add quantifiable metrics where appropriate
+4. Use industry-specific terminology from the JD
+5. Only modify bullets that need improvement (don't change perfect ones)
+
+AUDIENCE: Your optimized bullets will be evaluated by:
+- ATS systems scanning for JD keywords
+- Recruiters matching candidate experience to job requirements
+- Hiring managers looking for role-specific achievements
+
+STYLE:
+- Maintain the original meaning and authenticity
+- Integrate JD keywords naturally (don't force them)
+- Add metrics/numbers when contextually appropriate
+- Use action verbs that match the job's focus
+- Keep each bullet under 150 characters
+- Format: Return JSON mapping of original -> optimized bullets
+
+TONE: Professional, confident, achievement-focused. Show how the candidate's experience directly relates to the job requirements."""
 
 
 class OptimizationService:
@@ -20,15 +89,15 @@ class OptimizationService:
     Simple, focused bullet optimization service.
     Uses GPT-4 for quality rewrites.
     """
+
+    # Bullets sent per completion in optimize_resume
+    RESUME_CHUNK_SIZE = 5
     
-    def __init__(self):
-        settings = get_settings()
-        self.api_key = settings.OPENAI_API_KEY if hasattr(settings, 'OPENAI_API_KEY') else None
-        
-        if self.api_key and OPENAI_AVAILABLE:
-            self.client = AsyncOpenAI(api_key=self.api_key)
-        else:
-            self.client = None
+    def __init__(self, client=None):
+        # Shared pooled client unless one is injected
+        self.client = client or get_openai_client()
+        # Chunk rewrites are cached by content hash; re-runs skip the call
+        self.cache = get_result_cache()
     
     async def optimize_bullet(
         self,
@@ -59,30 +128,6 @@ class OptimizationService:
             context.append(f"Company: {company}")
         
         context_text = "\n".join(context) if context else "General optimization"
-        
-        # ROAST Framework Prompt
-        system_prompt = """ROLE: You are an expert resume writer and career coach with 15+ years of experience helping professionals land their dream jobs at top tech companies.
-
-OBJECTIVE: Transform a resume bullet point into a highly impactful, ATS-friendly statement that showcases quantifiable achievements and demonstrates clear business value.
-
-AUDIENCE: Your output will be read by:
-- Applicant Tracking Systems (ATS) that scan for keywords and metrics
-- Recruiters who spend 6-10 seconds per resume
-- Hiring managers looking for specific achievements and impact
-
-STYLE:
-- Use STAR method (Situation, Task, Action, Result) structure
-- Start with strong action verbs (Led, Engineered, Architected, Optimized, etc.)
-- Include specific, quantifiable metrics (numbers, percentages, scale)
-- CRITICAL: Maintain similar character count to the original (within 10 characters) to preserve resume layout
-- If original is ~100 chars, optimized should be ~100 chars (not 150 chars)
-- Use industry-standard terminology and keywords
-- Format: Single sentence, no bullet character, professional tone
-- DO NOT add excessive wordiness that would break single-page layout
-
-TONE: Confident, professional, achievement-focused. Sound like a top performer who delivers measurable results.
-
-LAYOUT CONSTRAINT: The optimized bullet MUST maintain approximately the same length as the original to preserve the one-page resume format. If you make it significantly longer, it will break the layout."""
 
         target_length = len(bullet)
         min_length = target_length - 10
@@ -109,7 +154,7 @@ Return your response as JSON:
                 messages=[
                     {
                         "role": "system",
-                        "content": system_prompt
+                        "content": BULLET_SYSTEM_PROMPT
                     },
                     {
                         "role": "user",
@@ -123,68 +168,228 @@ Return your response as JSON:
             result = json.loads(response.choices[0].message.content)
             return result.get("optimized", bullet)
             
-        except Exception as e:
-            print(f"Optimization failed: {e}")
+        except Exception:
+            logger.exception("Bullet optimization failed")
             return bullet
 
+    async def optimize_bullets(self, items: List[Dict[str, str]]) -> List[str]:
+        """
+        Optimize several independent bullets in a single completion.
+
+        Args:
+            items: List of {"bullet", "job_title", "company"} dicts
+
+        Returns:
+            Optimized bullet strings, in the same order as items.
+            Any bullet the model fails to return falls back to the original.
+        """
+        originals = [item["bullet"] for item in items]
+        if not self.client:
+            return originals
+
+        numbered = []
+        for index, item in enumerate(items, start=1):
+            context = []
+            if item.get("job_title"):
+                context.append(f"Job Title: {item['job_title']}")
+            if item.get("company"):
+                context.append(f"Company: {item['company']}")
+            context_text = ", ".join(context) if context else "General optimization"
+
+            target_length = len(item["bullet"])
+            numbered.append(
+                f"{index}. [{context_text}] (Length: {target_length} characters, "
+                f"keep between {target_length - 10} and {target_length + 10})\n"
+                f"{item['bullet']}"
+            )
+
+        user_prompt = f"""CURRENT BULLET POINTS ({len(items)} independent bullets, each with its own context):
+{chr(10).join(numbered)}
+
+TASK: Rewrite EACH bullet point independently following the ROAST framework guidelines above. Make each one more impactful, specific, and quantifiable while maintaining authenticity and its length constraint.
+
+Return your response as JSON with exactly {len(items)} entries, in the same order:
+{{
+  "optimized": ["improved bullet 1", "improved bullet 2", ...]
+}}"""
+
+        try:
+            response = await self.client.chat.completions.create(
+                model="gpt-4",
+                messages=[
+                    {"role": "system", "content": BULLET_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.7,
+                response_format={"type": "json_object"}
+            )
+
+            optimized = json.loads(response.choices[0].message.content).get("optimized", [])
+            if not isinstance(optimized, list):
+                return originals
+            return [
+                optimized[i] if i < len(optimized) and isinstance(optimized[i], str) and optimized[i]
+                else original
+                for i, original in enumerate(originals)
+            ]
+
+        except Exception:
+            logger.exception("Batched optimization of %d bullets failed", len(items))
+            return originals
+
     async def optimize_resume(
         self,
         resume_data: dict,
-        job_description: str
+        job_description: str,
+        regenerate: bool = False
     ) -> dict:
         """
         Optimize an entire resume based on a job description.
         Returns a dictionary of {original_bullet: optimized_bullet} mappings.
+
+        Rewrites are sampled (temperature 0.7) and cached for the cache TTL,
+        so a repeat run returns the same rewrites; regenerate=True skips the
+        cached ones and stores the fresh results in their place.
         """
-        if not self.client:
+        # Nothing to tailor against: skip extraction and every completion
+        if not self.client or not job_description.strip():
             return {}
 
-        # Extract bullets from resume (experience + projects)
-        bullets = []
-        for exp in resume_data.get("experience", []):
-            bullets.extend(exp.get("bullets", []))
-        
-        # Also include project bullets
-        for proj in resume_data.get("projects", []):
-            bullets.extend(proj.get("bullets", []))
-        
+        bullets = self._extract_bullets(resume_data)
         if not bullets:
             return {}
 
-        # We'll optimize in batches to save tokens/time
-        # For MVP, let's do a smart selection of the top 5 most relevant bullets to optimize
-        # or just optimize them all if < 10.
-        
-        # ROAST Framework Prompt for Full Resume Optimization
-        system_prompt = """ROLE: You are a senior resume optimization specialist who helps job seekers tailor their resumes to specific job descriptions, increasing their interview rate by 3-5x.
+        # Fan out one completion per chunk of bullets; total latency is
+        # roughly the slowest chunk instead of the sum of all of them.
+        results = await asyncio.gather(*[
+            self._optimize_bullet_chunk(chunk, job_description, regenerate)
+            for chunk in self._chunk_bullets(bullets)
+        ])
 
-OBJECTIVE: Analyze the job description and optimize resume bullet points to:
-1. Incorporate relevant keywords from the job description
-2. Align achievements with the role's requirements
-3. Add quantifiable metrics where appropriate
-4. Use industry-specific terminology from the JD
-5. Only modify bullets that need improvement (don't change perfect ones)
+        optimized: Dict[str, str] = {}
+        for result in results:
+            optimized.update(result)
+        return optimized
 
-AUDIENCE: Your optimized bullets will be evaluated by:
-- ATS systems scanning for JD keywords
-- Recruiters matching candidate experience to job requirements
-- Hiring managers looking for role-specific achievements
+    async def submit_resume_batch(
+        self,
+        resume_data: dict,
+        job_description: str
+    ) -> Dict[str, Any]:
+        """
+        Submit full-resume optimization as an OpenAI Batch API job.
 
-STYLE:
-- Maintain the original meaning and authenticity
-- Integrate JD keywords naturally (don't force them)
-- Add metrics/numbers when contextually appropriate
-- Use action verbs that match the job's focus
-- Keep each bullet under 150 characters
-- Format: Return JSON mapping of original -> optimized bullets
+        Same prompts as optimize_resume, but billed at the batch rate and
+        completed asynchronously (within 24h). Poll with get_resume_batch.
 
-TONE: Professional, confident, achievement-focused. Show how the candidate's experience directly relates to the job requirements."""
+        Returns:
+            {"batch_id": str, "status": str}
+        """
+        if not self.client:
+            raise RuntimeError("OpenAI client not configured")
 
-        user_prompt = f"""JOB DESCRIPTION:
+        bullets = self._extract_bullets(resume_data)
+        if not bullets:
+            raise ValueError("Resume has no bullets to optimize")
+
+        lines = []
+        for index, chunk in enumerate(self._chunk_bullets(bullets)):
+            lines.append(json.dumps({
+                "custom_id": f"chunk-{index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4",
+                    "messages": [
+                        {"role": "system", "content": RESUME_SYSTEM_PROMPT},
+                        {"role": "user", "content": self._build_resume_prompt(chunk, job_description)}
+                    ],
+                    "temperature": 0.7,
+                    "response_format": {"type": "json_object"}
+                }
+            }))
+
+        batch_file = await self.client.files.create(
+            file=("resume_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        return {"batch_id": batch.id, "status": batch.status}
+
+    async def get_resume_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Check a batch job submitted by submit_resume_batch.
+
+        Returns:
+            {"batch_id", "status", "optimized", "failed"} where optimized is
+            the merged {original_bullet: optimized_bullet} mapping once the
+            batch has completed, and failed counts chunks that errored.
+        """
+        if not self.client:
+            raise RuntimeError("OpenAI client not configured")
+
+        batch = await self.client.batches.retrieve(batch_id)
+        result: Dict[str, Any] = {
+            "batch_id": batch.id,
+            "status": batch.status,
+            "optimized": {},
+            "failed": batch.request_counts.failed if batch.request_counts else 0
+        }
+
+        if batch.status != "completed" or not batch.output_file_id:
+            return result
+
+        content = await self.client.files.content(batch.output_file_id)
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                response = json.loads(line)["response"]
+                if response["status_code"] != 200:
+                    result["failed"] += 1
+                    continue
+                message = response["body"]["choices"][0]["message"]["content"]
+                result["optimized"].update(json.loads(message))
+            except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+                logger.warning("Skipping malformed batch output line: %s", e)
+                result["failed"] += 1
+
+        return result
+
+    def _extract_bullets(self, resume_data: dict) -> List[str]:
+        """
+        Collect experience and project bullets from resume data.
+        Repeats are dropped: results are keyed by bullet text, so a
+        duplicate only costs prompt tokens.
+        """
+        bullets = []
+        for exp in resume_data.get("experience", []):
+            bullets.extend(exp.get("bullets", []))
+
+        for proj in resume_data.get("projects", []):
+            bullets.extend(proj.get("bullets", []))
+
+        return list(dict.fromkeys(bullets))
+
+    def _chunk_bullets(self, bullets: List[str]) -> List[List[str]]:
+        """Split bullets into RESUME_CHUNK_SIZE groups, one per completion"""
+        return [
+            bullets[i:i + self.RESUME_CHUNK_SIZE]
+            for i in range(0, len(bullets), self.RESUME_CHUNK_SIZE)
+        ]
+
+    def _build_resume_prompt(self, bullets: List[str], job_description: str) -> str:
+        """Build the user prompt for one chunk of resume bullets"""
+        return f"""JOB DESCRIPTION:
 {job_description[:2000]}
 
 CURRENT RESUME BULLETS:
-{json.dumps(bullets[:15], indent=2)}
+{json.dumps(bullets, indent=2)}
 
 TASK: Review each bullet point and optimize ONLY the ones that would benefit from:
 - Better keyword alignment with the job description
@@ -200,19 +405,46 @@ Return JSON mapping of ONLY the changed bullets:
   ...
 }}"""
 
-        try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-                response_format={"type": "json_object"}
-            )
-            
-            return json.loads(response.choices[0].message.content)
-            
-        except Exception as e:
-            print(f"Full optimization failed: {e}")
-            return {}
+    async def _optimize_bullet_chunk(
+        self,
+        bullets: List[str],
+        job_description: str,
+        regenerate: bool = False
+    ) -> Dict[str, str]:
+        """
+        Optimize one chunk of bullets against the job description.
+        Rate-limit (429) retries are left to the shared client's backoff.
+        """
+        user_prompt = self._build_resume_prompt(bullets, job_description)
+
+        # The prompt holds the chunk's bullets and the JD, so unchanged
+        # bullets re-optimized against the same job reuse the earlier rewrite
+        cache_key = "resume_chunk:" + content_hash(user_prompt)
+        cached = None if regenerate else await self.cache.get(cache_key)
+        if cached is not None:
+            return json.loads(cached)
+
+        async with get_chunk_semaphore():
+            try:
+                response = await self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        {"role": "system", "content": RESUME_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.7,
+                    response_format={"type": "json_object"}
+                )
+
+                content = response.choices[0].message.content
+                result = json.loads(content)
+                await self.cache.set(cache_key, content.encode("utf-8"))
+                return result
+
+            except RateLimitError as e:
+                logger.warning("Chunk optimization still rate limited after client retries: %s", e)
+                return {}
+
+            except Exception:
+                logger.exception("Chunk optimization failed")
+                return {}
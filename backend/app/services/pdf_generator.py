@@ -2,23 +2,53 @@
 PDF Generation Service - Creates professional one-page resumes
 Uses ReportLab for precise layout control
 """
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from io import BytesIO
-from datetime import datetime
 
-from reportlab.lib.pagesizes import letter, A4
+from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.pdfgen import canvas
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_JUSTIFY
 
+from app.core.config import get_settings
 from app.schemas.resume import Resume
 from app.services.one_page_engine import OnePageLayoutEngine
 
 
+# Color schemes per theme, built once at import
+THEME_COLORS = {
+    "professional": {
+        "primary": colors.HexColor("#2c3e50"),
+        "secondary": colors.HexColor("#34495e"),
+        "accent": colors.HexColor("#3498db"),
+        "text": colors.black,
+        "light": colors.HexColor("#95a5a6")
+    },
+    "modern": {
+        "primary": colors.HexColor("#1a237e"),
+        "secondary": colors.HexColor("#303f9f"),
+        "accent": colors.HexColor("#536dfe"),
+        "text": colors.black,
+        "light": colors.HexColor("#9fa8da")
+    },
+    "minimal": {
+        "primary": colors.black,
+        "secondary": colors.HexColor("#333333"),
+        "accent": colors.HexColor("#555555"),
+        "text": colors.black,
+        "light": colors.HexColor("#999999")
+    }
+}
+
+
 class PDFLayoutEngine:
     """
     Generates professional one-page PDF resumes with smart layout
@@ -53,30 +83,7 @@ class PDFLayoutEngine:
     
     def _get_theme_colors(self, theme: str) -> Dict[str, Any]:
         """Get color scheme for theme"""
-        themes = {
-            "professional": {
-                "primary": colors.HexColor("#2c3e50"),
-                "secondary": colors.HexColor("#34495e"),
-                "accent": colors.HexColor("#3498db"),
-                "text": colors.black,
-                "light": colors.HexColor("#95a5a6")
-            },
-            "modern": {
-                "primary": colors.HexColor("#1a237e"),
-                "secondary": colors.HexColor("#303f9f"),
-                "accent": colors.HexColor("#536dfe"),
-                "text": colors.black,
-                "light": colors.HexColor("#9fa8da")
-            },
-            "minimal": {
-                "primary": colors.black,
-                "secondary": colors.HexColor("#333333"),
-                "accent": colors.HexColor("#555555"),
-                "text": colors.black,
-                "light": colors.HexColor("#999999")
-            }
-        }
-        return themes.get(theme, themes["professional"])
+        return THEME_COLORS.get(theme, THEME_COLORS["professional"])
     
     def generate_pdf(self, resume: Resume, output_path: Optional[Path] = None) -> BytesIO:
         """
@@ -204,6 +211,10 @@ class PDFLayoutEngine:
         return buffer
     
     def _create_styles(self) -> Dict[str, ParagraphStyle]:
+        """Get paragraph styles for this font/size/theme (cached, read-only)"""
+        return _cached_styles(self.font_family, self.font_size, self.theme)
+
+    def _build_styles(self) -> Dict[str, ParagraphStyle]:
         """Create custom paragraph styles"""
         styles = {}
         
@@ -626,7 +637,7 @@ class PDFLayoutEngine:
         elements = []
 
         # Sort by order
-        sorted_sections = sorted(resume.flexible_sections, key=lambda x: x.order)
+        sorted_sections = sorted(resume.flexible_sections, key=attrgetter("order"))
 
         for section in sorted_sections:
             elements.append(Spacer(1, 0.12 * inch * spacing))
@@ -658,6 +669,17 @@ class PDFLayoutEngine:
         return elements
 
 
+@lru_cache(maxsize=32)
+def _cached_styles(font_family: str, font_size: float, theme: str) -> Dict[str, ParagraphStyle]:
+    """
+    Paragraph styles per font/size/theme, built once per worker process.
+
+    generate_pdf asks for styles on every spacing retry, and most exports
+    share the same handful of option combinations.
+    """
+    return PDFLayoutEngine(font_family=font_family, font_size=font_size, theme=theme)._build_styles()
+
+
 class ResumePDFGenerator:
     """Main service for generating resume PDFs"""
     
@@ -689,3 +711,49 @@ class ResumePDFGenerator:
         )
         
         return engine.generate_pdf(resume, output_path)
+
+
+def render_pdf_bytes(
+    resume_data: Dict[str, Any],
+    font_family: str = "Helvetica",
+    font_size: int = 10,
+    theme: str = "professional"
+) -> bytes:
+    """
+    Render a resume dict to PDF bytes.
+
+    Module-level and dict-in/bytes-out so it can run in a worker process
+    (see get_pdf_pool) without pickling Pydantic models.
+    """
+    buffer = ResumePDFGenerator.generate(
+        resume=Resume(**resume_data),
+        font_family=font_family,
+        font_size=font_size,
+        theme=theme
+    )
+    return buffer.getvalue()
+
+
+# Global process pool for CPU-bound ReportLab rendering
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the PDF rendering process pool (singleton)"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        # Spawn, not fork: this process runs threads (to_thread workers,
+        # httpx) whose held locks a forked child would inherit locked
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=get_settings().PDF_WORKERS or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_pool
+
+
+def shutdown_pdf_pool():
+    """Stop PDF worker processes (app shutdown)"""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+    _pdf_pool = None
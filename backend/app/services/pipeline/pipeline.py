@@ -11,6 +11,8 @@ STAGE 7: Optional LLM Optimization (user-triggered)
 
 This module handles stages 1-5.
 """
+import asyncio
+import logging
 from pathlib import Path
 from typing import Dict, Any
 from .stage1_raw_extraction import RawExtractor
@@ -18,15 +20,17 @@ from .stage2_llm_parsing import LLMStructuralParser
 from .stage3_semantic_cleanup import SemanticCleaner
 from app.services.layout import LayoutEngine
 
+logger = logging.getLogger(__name__)
+
 
 class ResumeParsingPipeline:
     """
     Complete parsing pipeline (Stages 1-5)
     """
 
-    def __init__(self, openai_api_key: str, layout_config: Dict[str, Any] = None):
+    def __init__(self, openai_api_key: str, layout_config: Dict[str, Any] = None, client=None):
         self.raw_extractor = RawExtractor()
-        self.llm_parser = LLMStructuralParser(api_key=openai_api_key)
+        self.llm_parser = LLMStructuralParser(api_key=openai_api_key, client=client)
         self.cleaner = SemanticCleaner()
 
         # Layout configuration (user-configurable)
@@ -52,35 +56,38 @@ class ResumeParsingPipeline:
         """
 
         # STAGE 1: Raw Extraction
-        print("[STAGE 1] Extracting raw text and metadata from PDF...")
-        raw_doc = self.raw_extractor.extract_from_pdf(file_path)
-        print(f"  ✓ Extracted {len(raw_doc.text_spans)} text spans")
-        print(f"  ✓ Raw text length: {len(raw_doc.raw_text)} characters")
+        raw_doc = await asyncio.to_thread(self.raw_extractor.extract_from_pdf, file_path)
+        logger.debug(
+            "[STAGE 1] Extracted %d text spans, %d characters",
+            len(raw_doc.text_spans), len(raw_doc.raw_text)
+        )
 
         # STAGE 2: LLM Structural Parsing (REQUIRED)
-        print("[STAGE 2] Using LLM to identify structure...")
         structured_data = await self.llm_parser.parse_structure(
             raw_doc.raw_text,
             raw_doc.text_spans
         )
-        print(f"  ✓ Identified {len(structured_data.get('experience', []))} experience entries")
-        print(f"  ✓ Identified {len(structured_data.get('projects', []))} project entries")
-        print(f"  ✓ Identified {len(structured_data.get('education', []))} education entries")
+        logger.debug(
+            "[STAGE 2] Identified %d experience, %d project, %d education entries",
+            len(structured_data.get("experience", [])),
+            len(structured_data.get("projects", [])),
+            len(structured_data.get("education", []))
+        )
 
         # STAGE 3: Semantic Cleanup
-        print("[STAGE 3] Cleaning text artifacts...")
         cleaned_data = self.cleaner.clean(structured_data)
-        print("  ✓ Text cleanup complete")
 
         # STAGE 4: Build Canonical JSON
-        print("[STAGE 4] Building canonical JSON...")
         canonical = self._build_canonical_json(cleaned_data)
-        print(f"  ✓ Canonical JSON complete ({self._count_sections(canonical)} sections)")
+        sections_found = self._count_sections(canonical)
+        logger.debug("[STAGE 4] Canonical JSON complete (%d sections)", sections_found)
 
         # STAGE 5: Deterministic Layout Engine
-        print("[STAGE 5] Rendering layout with grid-based engine...")
         layout_result = self.layout_engine.layout_resume(canonical)
-        print(f"  ✓ Layout rendered (compression level: {layout_result['compression_level']}, fits on page: {layout_result['fits_on_page']})")
+        logger.debug(
+            "[STAGE 5] Layout rendered (compression level: %s, fits on page: %s)",
+            layout_result["compression_level"], layout_result["fits_on_page"]
+        )
 
         return {
             "canonical": canonical,
@@ -88,7 +95,7 @@ class ResumeParsingPipeline:
             "metadata": {
                 "page_count": raw_doc.page_count,
                 "text_spans": len(raw_doc.text_spans),
-                "sections_found": self._count_sections(canonical),
+                "sections_found": sections_found,
                 "layout_compression": layout_result["compression_level"]
             }
         }
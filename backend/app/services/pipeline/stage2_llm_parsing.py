@@ -20,9 +20,15 @@ NO optimizing
 Output: canonical structured JSON exactly matching our schema
 If LLM cannot identify a part → mark as "unclassified" (don't drop it)
 """
+import asyncio
 import json
+import logging
 from typing import List, Dict, Any
 from openai import AsyncOpenAI
+from app.core.clients import get_http_client
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
 
 
 class LLMStructuralParser:
@@ -31,8 +37,19 @@ class LLMStructuralParser:
     NO rewriting, NO formatting
     """
 
-    def __init__(self, api_key: str):
-        self.client = AsyncOpenAI(api_key=api_key)
+    # Top-level sections requested per concurrent LLM call (when
+    # STAGE2_PARALLEL_SECTIONS is on; otherwise one call covers them all)
+    SECTION_GROUPS = [
+        ["header", "summary", "skills"],
+        ["experience"],
+        ["projects"],
+        ["education", "certifications", "awards", "unclassified"],
+    ]
+
+    def __init__(self, api_key: str, client: AsyncOpenAI = None):
+        # Reuse the shared connection pool even when building our own client
+        self.client = client or AsyncOpenAI(api_key=api_key, http_client=get_http_client())
+        self.parallel_sections = get_settings().STAGE2_PARALLEL_SECTIONS
 
     async def parse_structure(self, raw_text: str, text_spans: List[Any]) -> Dict[str, Any]:
         """
@@ -44,7 +61,7 @@ class LLMStructuralParser:
 
         # MOCK MODE - Return hardcoded canonical JSON for development
         # This allows testing Stages 3-7 without API costs
-        print("[STAGE 2] 🔧 MOCK MODE: Using hardcoded canonical JSON (swap with GPT-4o later)")
+        logger.debug("[STAGE 2] Mock mode: using hardcoded canonical JSON")
         return self._load_mock_stage2_output()
 
     async def _real_llm_parse(self, raw_text: str, text_spans: List[Any]) -> Dict[str, Any]:
@@ -157,6 +174,36 @@ OUTPUT FORMAT (strict JSON):
 }
 """
 
+        # Parallel mode parses each section group in its own concurrent call:
+        # latency is the slowest group, but every call resends the prompt and
+        # the full resume (~4x input tokens). Default is a single call.
+        if self.parallel_sections:
+            groups = self.SECTION_GROUPS
+        else:
+            groups = [[key for group in self.SECTION_GROUPS for key in group]]
+
+        results = await asyncio.gather(*[
+            self._parse_sections(system_prompt, raw_text, coord_hints, keys)
+            for keys in groups
+        ])
+
+        structured: Dict[str, Any] = {}
+        for keys, partial in zip(groups, results):
+            for key in keys:
+                if key in partial:
+                    structured[key] = partial[key]
+        return structured
+
+    async def _parse_sections(
+        self,
+        system_prompt: str,
+        raw_text: str,
+        coord_hints: str,
+        keys: List[str]
+    ) -> Dict[str, Any]:
+        """
+        Parse only the given top-level sections of the canonical JSON
+        """
         user_prompt = f"""Parse the structure of this resume. Copy ALL text EXACTLY.
 
 {coord_hints}
@@ -164,7 +211,7 @@ OUTPUT FORMAT (strict JSON):
 Resume text:
 {raw_text}
 
-Return pure structural JSON with exact text copied. Use the exact format specified in the system prompt."""
+Return pure structural JSON with exact text copied. Use the exact format specified in the system prompt, but include ONLY these top-level keys: {", ".join(keys)}."""
 
         try:
             response = await self.client.chat.completions.create(
@@ -183,7 +230,7 @@ Return pure structural JSON with exact text copied. Use the exact format specifi
         except Exception as e:
             # If LLM fails, we CANNOT continue with fallback
             # Structured parsing is REQUIRED
-            raise RuntimeError(f"LLM structural parsing REQUIRED but failed: {str(e)}")
+            raise RuntimeError(f"LLM structural parsing REQUIRED but failed ({', '.join(keys)}): {str(e)}")
 
     def _build_coordinate_hints(self, text_spans: List[Any]) -> str:
         """
@@ -391,7 +438,10 @@ Return pure structural JSON with exact text copied. Use the exact format specifi
             elif current_section == "education":
                 result["education"].append(current_entry)
 
-        print(f"[MOCK PARSER] Extracted: {len(result['experience'])} experience, {len(result['projects'])} projects, {len(result['education'])} education")
+        logger.debug(
+            "[MOCK PARSER] Extracted: %d experience, %d projects, %d education",
+            len(result["experience"]), len(result["projects"]), len(result["education"])
+        )
 
         return result
 
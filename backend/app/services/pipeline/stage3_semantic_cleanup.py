@@ -14,6 +14,13 @@ import re
 from typing import List, Dict, Any
 
 
+# Compiled once; _clean_text runs on every text field of every upload
+ZERO_WIDTH_RE = re.compile(r'[\u200b-\u200d\ufeff]')
+HYPHEN_BREAK_RE = re.compile(r'(\w)-\s*\n\s*(\w)')
+DUPLICATE_WORD_RE = re.compile(r'\b(\w+)\s+\1\b')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
 class SemanticCleaner:
     """
     Stage 3: Deterministic text cleanup
@@ -94,17 +101,17 @@ class SemanticCleaner:
             return text
 
         # Remove zero-width characters
-        text = re.sub(r'[\u200b-\u200d\ufeff]', '', text)
+        text = ZERO_WIDTH_RE.sub('', text)
 
         # Fix hyphenated line breaks (e.g., "optimiza-\ntion" → "optimization")
-        text = re.sub(r'(\w)-\s*\n\s*(\w)', r'\1\2', text)
+        text = HYPHEN_BREAK_RE.sub(r'\1\2', text)
 
         # Remove duplicate words that occur at line breaks
         # (e.g., "word word" → "word")
-        text = re.sub(r'\b(\w+)\s+\1\b', r'\1', text)
+        text = DUPLICATE_WORD_RE.sub(r'\1', text)
 
         # Normalize whitespace (multiple spaces → single space)
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
 
         # Remove leading/trailing whitespace
         text = text.strip()
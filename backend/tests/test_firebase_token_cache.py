@@ -0,0 +1,91 @@
+"""
+Tests for the verified-token cache in app.core.firebase
+"""
+import pytest
+
+from app.core import firebase
+
+
+class FakeVerifier:
+    """Stands in for auth.verify_id_token and counts calls"""
+
+    def __init__(self, lifetime: float = 3600):
+        self.calls = 0
+        self.lifetime = lifetime
+
+    def __call__(self, token: str) -> dict:
+        self.calls += 1
+        if token == "bad":
+            raise ValueError("bad token")
+        return {"uid": f"uid-{token}", "exp": firebase.time.time() + self.lifetime}
+
+
+class FakeClock:
+    def __init__(self, start: float = 1_000_000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    firebase.token_cache.clear()
+    yield
+    firebase.token_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(firebase.time, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def verifier(monkeypatch):
+    fake = FakeVerifier()
+    monkeypatch.setattr(firebase.auth, "verify_id_token", fake)
+    return fake
+
+
+async def test_repeat_token_is_served_from_cache(clock, verifier):
+    first = await firebase.verify_firebase_token("a")
+    second = await firebase.verify_firebase_token("a")
+
+    assert first == second
+    assert verifier.calls == 1
+
+
+async def test_entry_never_outlives_token_exp(clock, verifier):
+    verifier.lifetime = 10  # expires well before TOKEN_CACHE_TTL
+    await firebase.verify_firebase_token("a")
+    clock.now += 11
+    await firebase.verify_firebase_token("a")
+
+    assert verifier.calls == 2
+
+
+async def test_invalid_token_raises_and_is_not_cached(clock, verifier):
+    with pytest.raises(ValueError):
+        await firebase.verify_firebase_token("bad")
+
+    assert len(firebase.token_cache) == 0
+
+
+async def test_entry_expires_after_ttl(clock, verifier):
+    await firebase.verify_firebase_token("a")
+    clock.now += firebase.TOKEN_CACHE_TTL + 1
+    await firebase.verify_firebase_token("a")
+
+    assert verifier.calls == 2
+
+
+async def test_cache_is_bounded_oldest_first(clock, verifier, monkeypatch):
+    monkeypatch.setattr(firebase, "TOKEN_CACHE_MAX_SIZE", 2)
+    for token in ("a", "b", "c"):
+        await firebase.verify_firebase_token(token)
+
+    assert len(firebase.token_cache) == 2
+    await firebase.verify_firebase_token("a")  # evicted, verified again
+    assert verifier.calls == 4
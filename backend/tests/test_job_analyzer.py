@@ -0,0 +1,63 @@
+"""
+Tests for the no-LLM keyword matching in JobAnalyzer
+"""
+import pytest
+
+from app.services.job_analyzer import JobAnalysisResult, JobAnalyzer
+
+
+def analysis_for(*keywords):
+    return JobAnalysisResult(
+        required_keywords=list(keywords),
+        preferred_keywords=[],
+        missing_skills=[],
+        role_level="Mid",
+        industry="Technology",
+        key_responsibilities=[],
+    )
+
+
+def missing_keywords(resume, *keywords):
+    return JobAnalyzer()._analyze_gaps_basic(resume, analysis_for(*keywords)).missing_keywords
+
+
+@pytest.mark.parametrize("keyword, text", [
+    ("Java", "Built services in Java/Kotlin"),
+    ("SQL", "Tuned SQL/NoSQL stores"),
+    ("AWS", "Ran AWS-hosted workloads"),
+    ("React", "Shipped React.js dashboards"),
+    ("Docker", "Wrote Docker-compose files"),
+    ("Python", "Automated reports with python3"),
+    ("B.S.", "B.S. in Computer Science"),
+    ("C++", "Low-latency C++ code"),
+    ("C#", "Desktop tools in C#."),
+    (".NET", "Migrated ASP.NET services"),
+    ("CI/CD", "Owned the ci/cd pipeline"),
+    ("Node.js", "APIs in node.js, Go"),
+    ("Machine Learning", "Applied machine learning to churn"),
+    ("Spring Boot", "Backends in Java/Spring Boot"),
+])
+def test_keyword_found(keyword, text):
+    assert missing_keywords(text, keyword) == []
+
+
+@pytest.mark.parametrize("keyword, text", [
+    ("Java", "Frontend in JavaScript"),
+    ("SQL", "Document stores (NoSQL)"),
+    ("SQL", "Managed MySQL replicas"),
+    ("AI", "Answered email tickets"),
+    ("Go", "Good communication"),
+    ("C", "Low-latency C++ code"),
+    ("Machine Learning", "Machine shop, learning fast"),
+])
+def test_keyword_not_found_inside_other_words(keyword, text):
+    assert missing_keywords(text, keyword) == [keyword]
+
+
+def test_basic_gap_analysis_reports_only_missing_keywords():
+    resume = "Built Java/Kotlin services and React.js frontends"
+
+    gaps = JobAnalyzer()._analyze_gaps_basic(resume, analysis_for("Java", "React", "Kubernetes"))
+
+    assert gaps.missing_keywords == ["Kubernetes"]
+    assert gaps.alignment_score == 95
@@ -0,0 +1,51 @@
+"""
+Tests for the in-memory ResultCache size budget and TTL
+"""
+from app.db.cache import ResultCache
+
+
+async def test_least_recently_used_entry_is_evicted_over_budget():
+    cache = ResultCache(ttl=60, max_bytes=10)
+    await cache.set("a", b"aaaa")
+    await cache.set("b", b"bbbb")
+    assert await cache.get("a") == b"aaaa"  # touch: b is now oldest
+
+    await cache.set("c", b"cccc")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"aaaa"
+    assert await cache.get("c") == b"cccc"
+    assert cache._size == 8
+
+
+async def test_overwrite_replaces_size_accounting():
+    cache = ResultCache(ttl=60, max_bytes=10)
+    await cache.set("a", b"aaaa")
+    await cache.set("a", b"aaaaaaaa")
+
+    assert cache._size == 8
+    assert await cache.get("a") == b"aaaaaaaa"
+
+
+async def test_value_larger_than_budget_is_not_kept():
+    cache = ResultCache(ttl=60, max_bytes=10)
+    await cache.set("big", b"x" * 20)
+
+    assert await cache.get("big") is None
+    assert cache._size == 0
+
+
+async def test_zero_budget_is_unbounded():
+    cache = ResultCache(ttl=60, max_bytes=0)
+    for i in range(100):
+        await cache.set(str(i), b"x" * 1024)
+
+    assert await cache.get("0") == b"x" * 1024
+
+
+async def test_expired_entry_is_dropped():
+    cache = ResultCache(ttl=-1, max_bytes=10)
+    await cache.set("a", b"aaaa")
+
+    assert await cache.get("a") is None
+    assert cache._size == 0
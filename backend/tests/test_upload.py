@@ -0,0 +1,53 @@
+"""
+Tests for upload validation
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import upload
+from app.core.dependencies import get_current_user
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(upload, "UPLOAD_DIR", tmp_path)
+    app = FastAPI()
+    app.include_router(upload.router, prefix="/api/upload")
+    app.dependency_overrides[get_current_user] = lambda: {"uid": "user-1"}
+    return TestClient(app)
+
+
+def test_rejects_file_over_size_limit(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(upload, "MAX_UPLOAD_SIZE", 1024)
+    body = b"%PDF-1.7\n" + b"0" * 4096
+
+    response = client.post("/api/upload/", files={"file": ("resume.pdf", body)})
+
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_size_limit_counts_every_chunk(client, tmp_path, monkeypatch):
+    # Limit sits between chunk boundaries: the first chunk fits, the total does not
+    monkeypatch.setattr(upload, "MAX_UPLOAD_SIZE", upload.UPLOAD_CHUNK_SIZE + 10)
+    body = b"%PDF-1.7\n" + b"0" * (upload.UPLOAD_CHUNK_SIZE * 2)
+
+    response = client.post("/api/upload/", files={"file": ("resume.pdf", body)})
+
+    assert response.status_code == 413
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rejects_pdf_whose_content_is_not_pdf(client, tmp_path):
+    response = client.post("/api/upload/", files={"file": ("resume.pdf", b"PK\x03\x04not a pdf")})
+
+    assert response.status_code == 400
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rejects_docx_whose_content_is_not_a_zip(client, tmp_path):
+    response = client.post("/api/upload/", files={"file": ("resume.docx", b"%PDF-1.7\n")})
+
+    assert response.status_code == 400
+    assert list(tmp_path.iterdir()) == []